@@ -18,12 +18,15 @@ This module provides a collection of functions and classes for working with geog
 * `latlon2str`: Converts latitude and longitude to a string representation.
 
 **Coordinate Transformations**
-* `gps2xy`: Converts Earth-centered coordinates (latitude, longitude) to Cartesian (x,y,z) coordinates.
+* `gps2xy`: Converts Earth-centered coordinates (latitude, longitude) to Cartesian (x,y,z) coordinates, element-wise over arrays.
+* `gps2xy_scalar`: Converts a single (latitude, longitude) pair to a dictionary of Cartesian (x,y,z) coordinates.
 
 **Distance Calculations**
 * `distance_euclidean`: Calculates the Euclidean distance between two points.
 * `distance_manhattan`: Calculates the Manhattan distance (or Taxicab geometry) between two points.
 * `distance_haversine`: Calculates the geographical distance (or great-circle) between two points using the Haversine formula.
+* `distance_haversine_batch`: Calculates the geographical distances between arrays of coordinates using a vectorized Haversine formula.
+* `haversine_matrix`: Calculates the Haversine distance matrix between two sets of points, in parallel when Numba is installed.
 
 **Unit Conversions**
 * `kilometers_to_miles`: Converts kilometers to miles.
@@ -31,15 +34,23 @@ This module provides a collection of functions and classes for working with geog
 
 **Nearest Point Finding**
 * `find_nearest_point`: Finds the nearest point from a given row to a set of destination points based on a specified column.
+* `nearest_point_batch`: Finds, for every source point, the nearest destination point using a vectorized Haversine distance matrix.
+* `build_nearest_index`: Builds a reusable KD-tree spatial index over destination points for nearest point queries.
 
 **Polyline Decoding**
-* `decode_polyline`: Decodes a polyline encoded string into a list of latitude/longitude coordinates.
+* `decode_polyline`: Decodes a polyline encoded string into an array of longitude/latitude coordinates.
+* `decode_polyline_list`: Decodes a polyline encoded string into a list of longitude/latitude coordinates.
 
 **Shapely Conversion**
 * `to_shapely`: Converts a list of coordinates into a Shapely MultiLineString object.
+* `to_shapely_batch`: Converts many lists of coordinates into an array of Shapely MultiLineString objects in one vectorized call.
 
 **Class Point**
 *  Class `Point` provides a convenient way to represent and work with geographic points in your applications.
+
+**Class PointArray**
+*  Class `PointArray` stores many points as parallel NumPy columns, so geometry routines run on whole columns at once.  
+*  Class `PointView` is a lightweight, copy-free view on a single point of a `PointArray`.
 """
 import numpy
 import json
@@ -47,14 +58,18 @@ import polyline
 import shapely
 
 from copy import copy, deepcopy
-from math import radians, cos, sin, asin, sqrt
-from shapely.ops import nearest_points
+from math import radians, cos, sin, asin, sqrt, isfinite
 from shapely.geometry import MultiLineString
 
 from gistools.utils     import is_list, is_float, format_float, is_integer
-from gistools.utils     import none_dict
+from gistools.utils     import njit, prange, numba
 from gistools.plus_code import encode
 
+try:
+	import orjson
+except ImportError: # orjson is optional, only used by PointArray.to_ndjson
+	orjson = None
+
 EARTH_RADIUS = 6378.388 
 """ The Earth's radius in kilometers (6378.388). See [Earth Radius in Wikipedia](https://en.wikipedia.org/wiki/Earth_radius)."""
 
@@ -63,18 +78,39 @@ __all__ = [
 	'latlon', 
 	'latlon2str', 
 	'gps2xy', 
+	'gps2xy_scalar', 
 	'distance_euclidean', 
 	'distance_manhattan', 
 	'distance_haversine',
+	'distance_haversine_batch',
+	'haversine_matrix',
 	'kilometers_to_miles',
 	'miles_to_kilometers',
 	'find_nearest_point',
+	'nearest_point_batch',
+	'build_nearest_index',
 	'decode_polyline',
+	'decode_polyline_list',
 	'to_shapely',
+	'to_shapely_batch',
 	'POINT', 
-	'Point'
+	'Point',
+	'PointArray',
+	'PointView'
 ]
 
+_LATLON_KEYS = (
+	('lat', 'lng'), 
+	('Lat', 'Lng'), 
+	('latitude', 'longitude'), 
+	('Latitude', 'Longitude'), 
+	('lat', 'lon'), 
+	('Lat', 'Lon')
+)
+""" The (latitude, longitude) key pairs recognized by `latlon`, in order of precedence."""
+
+_NUMBER_TYPES = (int, float, numpy.integer, numpy.floating)
+
 def latlon(arg):
 	"""
 	Extracts latitude and longitude from various input formats.
@@ -91,29 +127,26 @@ def latlon(arg):
 	if isinstance(arg, shapely.geometry.Point):
 		return arg.y, arg.x
 
-	else:
-		if isinstance(arg, dict):
-			if 'geometry' in arg:
-				return arg['geometry'].y, arg['geometry'].x
-
-			elif "lat" in arg and "lng" in arg:
-				return arg["lat"], arg["lng"]
-			elif "Lat" in arg and "Lng" in arg:
-				return arg["Lat"], arg["Lng"]
-			elif "latitude" in arg and "longitude" in arg:
-				return arg["latitude"], arg["longitude"]
-			elif "Latitude" in arg and "Longitude" in arg:
-				return arg["Latitude"], arg["Longitude"]
-			elif "lat" in arg and "lon" in arg:
-				return arg["lat"], arg["lon"]
-			elif "Lat" in arg and "Lon" in arg:
-				return arg["Lat"], arg["Lon"]
-
-		elif is_list(arg) or isinstance(arg, tuple):
-			if is_float(arg[0]) and is_float(arg[1]):
-				return arg[0], arg[1]
-			else:
-				raise TypeError("Oops! Expected a lat/lng dict or tuple but got %s" % type(arg).__name__)
+	if isinstance(arg, (tuple, list)):
+		lat, lon = arg[0], arg[1]
+
+		# Fast path: plain numbers, NaN excluded (NaN != NaN)
+		if isinstance(lat, _NUMBER_TYPES) and isinstance(lon, _NUMBER_TYPES) and lat == lat and lon == lon:
+			return lat, lon
+
+	if isinstance(arg, dict):
+		if 'geometry' in arg:
+			return arg['geometry'].y, arg['geometry'].x
+
+		for la, ln in _LATLON_KEYS:
+			if la in arg and ln in arg:
+				return arg[la], arg[ln]
+
+	elif is_list(arg) or isinstance(arg, tuple):
+		if is_float(arg[0]) and is_float(arg[1]):
+			return arg[0], arg[1]
+		else:
+			raise TypeError("Oops! Expected a lat/lng dict or tuple but got %s" % type(arg).__name__)
 
 	return None, None
 
@@ -133,8 +166,31 @@ def latlon2str(latitude, longitude):
 def gps2xy(lat, lng):
 	"""
 	Converts Earth-centered coordinates (latitude, longitude) to Cartesian (x,y,z) coordinates.  
+	Accepts scalars or array-likes and computes all points at once with NumPy.  
 	See [stackoverflow](http://stackoverflow.com/questions/1185408/converting-from-longitude-latitude-to-cartesian-coordinates).
 
+	Args:  
+	- **lat (float, array-like)**: Latitude(s) in degrees.  
+	- **lng (float, array-like)**: Longitude(s) in degrees.  
+
+	Returns:  
+	- **numpy.ndarray**: An array of shape `(..., 3)` holding the x, y and z Cartesian coordinates.
+	"""
+	lat_r = numpy.radians(numpy.asarray(lat, dtype=numpy.float64))
+	lng_r = numpy.radians(numpy.asarray(lng, dtype=numpy.float64))
+	cl    = numpy.cos(lat_r)
+
+	x = EARTH_RADIUS * cl * numpy.cos(lng_r)
+	y = EARTH_RADIUS * cl * numpy.sin(lng_r)
+	z = EARTH_RADIUS * numpy.sin(lat_r)
+
+	return numpy.stack([x, y, z], axis=-1)
+
+def gps2xy_scalar(lat, lng):
+	"""
+	Converts a single (latitude, longitude) pair to Cartesian (x,y,z) coordinates.  
+	Kept for callers relying on the dictionary output of former `gps2xy` versions.
+
 	Args:  
 	- **lat (float)**: Latitude in degrees.  
 	- **lng (float)**: Longitude in degrees.  
@@ -151,42 +207,86 @@ def gps2xy(lat, lng):
 	
 	return {'x': x, 'y': y, 'z': z}
 
+@njit(cache=True)
+def _euclidean_core(x1, y1, x2, y2):
+	dx = x1 - x2
+	dy = y1 - y2
+
+	return sqrt((dx*dx) + (dy*dy))
+
+@njit(cache=True)
+def _manhattan_core(x1, y1, x2, y2):
+	return abs(x1 - x2) + abs(y1 - y2)
+
+@njit(cache=True)
+def _haversine_core(lat1, lon1, lat2, lon2):
+	dlat = radians(lat2 - lat1)
+	dlon = radians(lon2 - lon1)
+	lat1 = radians(lat1)
+	lat2 = radians(lat2)
+
+	a = sin(dlat/2)**2 + cos(lat1)*cos(lat2)*sin(dlon/2)**2
+	c = 2*asin(sqrt(a))
+
+	return EARTH_RADIUS * c * 1000
+
+@njit(cache=True)
+def _haversine_from_radians(lat1r, lon1r, cos1, lat2r, lon2r, cos2):
+	a = sin((lat2r - lat1r)/2)**2 + cos1*cos2*sin((lon2r - lon1r)/2)**2
+	c = 2*asin(sqrt(a))
+
+	return EARTH_RADIUS * c * 1000
+
 def distance_euclidean(p1, p2):
 	"""
 	Calculates the Euclidean distance between two points.  
 	$d(p1, p2) = \sqrt(p1 - p2)^2$
 
 	Args:  
-	- **p1 (dict)**: A dictionary containing 'x' and 'y' coordinates of the first point.  
-	- **p2 (dict)**: A dictionary containing 'x' and 'y' coordinates of the second point.  
+	- **p1 (dict, numpy.ndarray)**: A dictionary containing 'x' and 'y' coordinates of the first point(s), or an array of shape `(..., 2)`.  
+	- **p2 (dict, numpy.ndarray)**: A dictionary containing 'x' and 'y' coordinates of the second point(s), or an array of shape `(..., 2)`.  
 
 	Returns:  
-	- **float**: The Euclidean distance between the two points.
+	- **float, numpy.ndarray**: The Euclidean distance(s) between the points.
 	"""
-	dx = p1['x'] - p2['x']
-	dy = p1['y'] - p2['y']
+	x1, y1 = _xy(p1)
+	x2, y2 = _xy(p2)
 
-	dist = sqrt((dx*dx) + (dy*dy))
+	if isinstance(x1, numpy.ndarray) or isinstance(x2, numpy.ndarray):
+		return numpy.sqrt((x1 - x2)**2 + (y1 - y2)**2)
 
-	return dist 
+	return _euclidean_core(x1, y1, x2, y2)
 	
 def distance_manhattan(p1, p2): 
 	"""
 	Calculates the Manhattan distance (or Taxicab geometry) between two points.
 
 	Args:  
-	- **p1 (dict)**: A dictionary containing 'x' and 'y' coordinates of the first point.  
-	- **p2 (dict)**: A dictionary containing 'x' and 'y' coordinates of the second point.  
+	- **p1 (dict, numpy.ndarray)**: A dictionary containing 'x' and 'y' coordinates of the first point(s), or an array of shape `(..., 2)`.  
+	- **p2 (dict, numpy.ndarray)**: A dictionary containing 'x' and 'y' coordinates of the second point(s), or an array of shape `(..., 2)`.  
 
 	Returns:  
-	- float: The Manhattan distance between the two points.
+	- **float, numpy.ndarray**: The Manhattan distance(s) between the points.
 	"""
-	dx = p1['x'] - p2['x']
-	dy = p1['y'] - p2['y']
+	x1, y1 = _xy(p1)
+	x2, y2 = _xy(p2)
 
-	dist = abs(dx) + abs(dy)
+	if isinstance(x1, numpy.ndarray) or isinstance(x2, numpy.ndarray):
+		return numpy.abs(x1 - x2) + numpy.abs(y1 - y2)
 
-	return dist
+	return _manhattan_core(x1, y1, x2, y2)
+
+def _xy(p):
+	if isinstance(p, numpy.ndarray):
+		return p[..., 0], p[..., 1]
+
+	x, y = p['x'], p['y']
+
+	if is_list(x):
+		x = numpy.asarray(x, dtype=numpy.float64)
+		y = numpy.asarray(y, dtype=numpy.float64)
+
+	return x, y
 
 def distance_haversine(p1, p2):
 	"""
@@ -202,17 +302,76 @@ def distance_haversine(p1, p2):
 	c1 = latlon(p1)
 	c2 = latlon(p2)
 
-	dlat = radians(c2[0] - c1[0])
-	dlon = radians(c2[1] - c1[1])
-	lat1 = radians(c1[0])
-	lat2 = radians(c2[0])
+	return _haversine_core(c1[0], c1[1], c2[0], c2[1])
 
-	a = sin(dlat/2)**2 + cos(lat1)*cos(lat2)*sin(dlon/2)**2
-	c = 2*asin(sqrt(a))
-	dist = EARTH_RADIUS * c * 1000
+def distance_haversine_batch(lat1, lon1, lat2, lon2):
+	"""
+	Calculates the geographical distances (or great-circle) between arrays of coordinates using the Haversine formula.  
+	The computation is vectorized with NumPy, so whole columns can be processed in a single call. 
+	Inputs follow the NumPy broadcasting rules (scalars, 1-D arrays, or e.g. `(M, 1)` against `(1, N)` arrays).
+
+	Args:  
+	- **lat1 (float, array-like)**: Latitude(s) of the first point(s) in degrees.  
+	- **lon1 (float, array-like)**: Longitude(s) of the first point(s) in degrees.  
+	- **lat2 (float, array-like)**: Latitude(s) of the second point(s) in degrees.  
+	- **lon2 (float, array-like)**: Longitude(s) of the second point(s) in degrees.  
+
+	Returns:  
+	- **numpy.ndarray**: The geographical distances in meters between the points.
+	"""
+	lat1r = numpy.radians(lat1)
+	lon1r = numpy.radians(lon1)
+	lat2r = numpy.radians(lat2)
+	lon2r = numpy.radians(lon2)
+
+	dlat = lat2r - lat1r
+	dlon = lon2r - lon1r
+
+	a = numpy.sin(dlat*0.5)**2 + numpy.cos(lat1r)*numpy.cos(lat2r)*numpy.sin(dlon*0.5)**2
+	dist = 2 * EARTH_RADIUS * numpy.arcsin(numpy.sqrt(a)) * 1000
 
 	return dist
 
+def haversine_matrix(src, dst):
+	"""
+	Calculates the Haversine distance matrix between two sets of points.  
+	Coordinates are converted to radians once; when Numba is installed, rows are computed 
+	in parallel by a compiled kernel, otherwise a NumPy broadcast is used.
+
+	Args:  
+	- **src (array-like, PointArray)**: The M source points, as an array of shape `(M, 2)` of (latitude, longitude) or a PointArray.  
+	- **dst (array-like, PointArray)**: The N destination points, as an array of shape `(N, 2)` of (latitude, longitude) or a PointArray.  
+
+	Returns:  
+	- **numpy.ndarray**: An array of shape `(M, N)` of distances in meters.
+	"""
+	src = numpy.asarray(getattr(src, 'coordinates', src), dtype=numpy.float64).reshape(-1, 2)
+	dst = numpy.asarray(getattr(dst, 'coordinates', dst), dtype=numpy.float64).reshape(-1, 2)
+
+	if numba is None:
+		return distance_haversine_batch(
+			src[:, 0, numpy.newaxis], src[:, 1, numpy.newaxis], 
+			dst[numpy.newaxis, :, 0], dst[numpy.newaxis, :, 1]
+		)
+
+	src = numpy.radians(src)
+	dst = numpy.radians(dst)
+	out = numpy.empty((len(src), len(dst)), dtype=numpy.float64)
+
+	_haversine_matrix(
+		numpy.ascontiguousarray(src[:, 0]), numpy.ascontiguousarray(src[:, 1]), numpy.cos(src[:, 0]), 
+		numpy.ascontiguousarray(dst[:, 0]), numpy.ascontiguousarray(dst[:, 1]), numpy.cos(dst[:, 0]), 
+		out
+	)
+
+	return out
+
+@njit(parallel=True, cache=True)
+def _haversine_matrix(lat1, lon1, cos1, lat2, lon2, cos2, out):
+	for i in prange(lat1.shape[0]):
+		for j in range(lat2.shape[0]):
+			out[i, j] = _haversine_from_radians(lat1[i], lon1[i], cos1[i], lat2[j], lon2[j], cos2[j])
+
 def kilometers_to_miles(km, ratio = 0.621371):
 	"""
 	Converts kilometers to miles. 1 Kilometer = 0.621371 Mile.
@@ -239,28 +398,185 @@ def miles_to_kilometers(mi, ratio = 0.621371):
 	"""
 	return mi / ratio
 
-def find_nearest_point(row, destination, column, geom_col='geometry'):
+def find_nearest_point(row, destination, column, geom_col='geometry', index=None):
 	"""
-	Finds the nearest point from a given row to a set of destination points based on a specified column.
+	Finds the nearest point from a given row to a set of destination points based on a specified column.  
+	Points in a geographic CRS are compared by Haversine distance, other geometries or projected CRS by planar distance.
 
 	Args:  
 	- **row (pandas.Series)**: The row containing the point to find the nearest point to.  
 	- **destination (pandas.DataFrame)**: The DataFrame containing the destination points.  
 	- **column (str)**: The column name in the destination DataFrame to retrieve the value from.  
 	- **geom_col (str, optional)**: The name of the geometry column in both row and destination. Defaults to 'geometry'.  
+	- **index (scipy.spatial.cKDTree, optional)**: A spatial index built with `build_nearest_index` on the destination.  
+	Build it once and pass it to every call to get O(log N) queries. Defaults to None (brute-force scan).
 
 	Returns:  
 	- **object**: The value from the specified column in the destination DataFrame corresponding to the nearest point.
 	"""
-	nearest_geom = nearest_points(row[geom_col], destination[geom_col].unary_union)
-	match_geom   = destination.loc[destination.geometry == nearest_geom[1]]
-	match_value  = match_geom[column].to_numpy()[0]
+	geom = row[geom_col]
+
+	if index is not None:
+		_, idx = index.query(gps2xy(geom.y, geom.x), k=1)
+		return destination[column].iloc[idx]
+
+	if not _is_geographic_points([geom], destination[geom_col]):
+		idx = _nearest_indices_planar([geom], destination[geom_col])
+	else:
+		idx = _nearest_indices(
+			numpy.asarray([geom.y]), numpy.asarray([geom.x]), 
+			destination[geom_col].y.to_numpy(), destination[geom_col].x.to_numpy()
+		)
+
+	return destination[column].to_numpy()[idx[0]]
+
+def nearest_point_batch(source, destination, column, geom_col='geometry', index=None):
+	"""
+	Finds, for every source point, the nearest destination point using a vectorized Haversine distance matrix.  
+	The `(M, N)` distance matrix is computed in a single NumPy broadcast, so no Python loop runs per row.
+
+	Args:  
+	- **source (geopandas.GeoDataFrame)**: The GeoDataFrame containing the M points to find the nearest point to.  
+	- **destination (geopandas.GeoDataFrame)**: The GeoDataFrame containing the N destination points.  
+	- **column (str)**: The column name in the destination GeoDataFrame to retrieve the values from.  
+	- **geom_col (str, optional)**: The name of the geometry column in both source and destination. Defaults to 'geometry'.  
+	- **index (scipy.spatial.cKDTree, optional)**: A spatial index built with `build_nearest_index` on the destination.  
+	If given, the index is queried instead of computing the full distance matrix. Defaults to None.
+
+	Returns:  
+	- **numpy.ndarray**: The M values from the specified column corresponding to the nearest destination points.
+	"""
+	if index is None and not _is_geographic_points(source[geom_col], destination[geom_col]):
+		return destination[column].to_numpy()[_nearest_indices_planar(source[geom_col], destination[geom_col])]
+
+	src_lat = source[geom_col].y.to_numpy()
+	src_lon = source[geom_col].x.to_numpy()
+
+	if index is not None:
+		_, idx = index.query(gps2xy(src_lat, src_lon), k=1)
+	else:
+		idx = _nearest_indices(
+			src_lat, src_lon, 
+			destination[geom_col].y.to_numpy(), destination[geom_col].x.to_numpy()
+		)
+
+	return destination[column].to_numpy()[idx]
+
+def _is_geographic_points(source, destination):
+	# The Haversine paths read `.y`/`.x` as latitude/longitude: they only apply to points in a geographic CRS 
+	# (or without CRS, taken as longitude/latitude like everywhere in this module)
+	crs = getattr(destination, 'crs', None)
+	if crs is not None and not crs.is_geographic:
+		return False
+
+	types = shapely.get_type_id(numpy.concatenate([numpy.asarray(source, dtype=object), numpy.asarray(destination, dtype=object)]))
+
+	return bool((types == shapely.GeometryType.POINT).all())
+
+def _nearest_indices_planar(source, destination):
+	# Any geometry type and CRS: planar nearest neighbour with a shapely STRtree, the first match wins on ties
+	tree = shapely.STRtree(numpy.asarray(destination, dtype=object))
+	idx  = numpy.zeros(len(source), dtype=numpy.intp)
+
+	found = tree.query_nearest(numpy.asarray(source, dtype=object), all_matches=False)
+	idx[found[0]] = found[1]
+
+	return idx
+
+def build_nearest_index(destination, geom_col='geometry'):
+	"""
+	Builds a reusable KD-tree spatial index over destination points for nearest point queries.  
+	Points are projected to Earth-centered Cartesian (x,y,z) coordinates, where the straight-line 
+	distance increases with the great-circle distance, so the nearest neighbour in the tree is 
+	also the nearest point by Haversine distance. Building costs O(N log N) once; each query is O(log N).
 
-	return match_value
+	Args:  
+	- **destination (geopandas.GeoDataFrame)**: The GeoDataFrame containing the destination points.  
+	- **geom_col (str, optional)**: The name of the geometry column. Defaults to 'geometry'.  
 
-def decode_polyline(encoded: str):
+	Returns:  
+	- **scipy.spatial.cKDTree**: The spatial index, to be passed to `find_nearest_point` or `nearest_point_batch`.
 	"""
-	Decodes a polyline encoded string into a list of latitude/longitude coordinates.
+	from scipy.spatial import cKDTree
+
+	return cKDTree(gps2xy(destination[geom_col].y.to_numpy(), destination[geom_col].x.to_numpy()))
+
+def _nearest_indices(src_lat, src_lon, dst_lat, dst_lon):
+	dist = haversine_matrix(
+		numpy.stack([src_lat, src_lon], axis=-1), 
+		numpy.stack([dst_lat, dst_lon], axis=-1)
+	)
+
+	return dist.argmin(axis=1)
+
+def decode_polyline(encoded: str) -> numpy.ndarray:
+	"""
+	Decodes a polyline encoded string into an array of longitude/latitude coordinates.
+
+	Args:  
+	- **encoded (str)**: The encoded polyline string.  
+
+	Returns:  
+	- **numpy.ndarray**: A contiguous array of shape `(N, 2)` of [longitude, latitude] coordinates.
+	"""
+	if numba is not None:
+		try:
+			buf = numpy.frombuffer(encoded.encode('ascii'), dtype=numpy.uint8)
+		except UnicodeEncodeError:
+			buf = None
+
+		if buf is not None:
+			out = numpy.empty((len(buf) // 2, 2), dtype=numpy.float64)
+			n   = _decode_polyline_core(buf, out)
+
+			if n >= 0:
+				return out[:n].copy()
+
+	# pure Python path, also raises the usual errors on malformed input
+	arr = numpy.asarray(polyline.decode(encoded), dtype=numpy.float64).reshape(-1, 2)
+
+	return arr[:, ::-1].copy()
+
+@njit(cache=True)
+def _decode_polyline_core(buf, out, factor=1e5):
+	# writes [longitude, latitude] rows into `out`, returns the row count or -1 on truncated input
+	size  = len(buf)
+	index = 0
+	count = 0
+	lat   = 0
+	lng   = 0
+
+	while index < size:
+		for k in range(2):
+			result = 0
+			shift  = 0
+			byte   = 0x20
+
+			while byte >= 0x20:
+				if index >= size:
+					return -1
+
+				byte   = numpy.int64(buf[index]) - 63
+				index += 1
+				result |= (byte & 0x1f) << shift
+				shift += 5
+
+			delta = ~(result >> 1) if result & 1 else (result >> 1)
+
+			if k == 0:
+				lat += delta
+			else:
+				lng += delta
+
+		out[count, 0] = lng / factor
+		out[count, 1] = lat / factor
+		count += 1
+
+	return count
+
+def decode_polyline_list(encoded: str) -> list:
+	"""
+	Decodes a polyline encoded string into a list of longitude/latitude coordinates.
 
 	Args:  
 	- **encoded (str)**: The encoded polyline string.  
@@ -275,13 +591,40 @@ def to_shapely(points):
 	Converts a list of coordinates into a Shapely MultiLineString object.
 
 	Args:  
-	- **points (list)**: A list of [longitude, latitude] coordinates.  
+	- **points (list, numpy.ndarray)**: A list or an array of shape `(N, 2)` of [longitude, latitude] coordinates.  
 
 	Returns:  
 	- **shapely.geometry.MultiLineString**: The Shapely MultiLineString object representing the points.  
 	"""
 	return MultiLineString([points])
 
+def to_shapely_batch(lines):
+	"""
+	Converts many lists of coordinates into Shapely MultiLineString objects.  
+	All geometries are built by Shapely's vectorized constructors in a single call, 
+	and the result can be wrapped directly in a `geopandas.GeoSeries`.
+
+	Args:  
+	- **lines (list)**: A list of lists of [longitude, latitude] coordinates.  
+
+	Returns:  
+	- **numpy.ndarray**: An object array of `shapely.geometry.MultiLineString`, one per input list.  
+	"""
+	coords = [numpy.asarray(line, dtype=numpy.float64).reshape(-1, 2) for line in lines]
+
+	if len(coords) == 0:
+		return numpy.empty(0, dtype=object)
+
+	offsets = numpy.zeros(len(coords) + 1, dtype=numpy.int64)
+	numpy.cumsum([len(c) for c in coords], out=offsets[1:])
+
+	# one line per multi-line, so the part offsets are simply 0..N
+	return shapely.from_ragged_array(
+		shapely.GeometryType.MULTILINESTRING, 
+		numpy.concatenate(coords), 
+		(offsets, numpy.arange(len(coords) + 1, dtype=numpy.int64))
+	)
+
 #==============================================================================
 #
 #   P o i n t 
@@ -300,6 +643,8 @@ POINT = [
 ]
 """ A list of attributes defining the structure of a Point object."""
 
+_POINT_TEMPLATE = dict.fromkeys(POINT)
+
 class Point:
 	"""
 	Represents a geographic point with latitude, longitude, and optional metadata.
@@ -331,11 +676,13 @@ class Point:
 		- `plus_code`: Returns the Plus Code representation of the point.  
 		- `copy()`: Returns a shallow copy of the Point object.  
 		- `deepcopy()`: Returns a deep copy of the Point object.  
-		- `distance`(other): Calculates the Haversine distance between this point and another.  
+		- `distance`(other): Calculates the Haversine distance between this point and another (or a list of others).  
 		- `to_dict`(): Returns the data dictionary containing all attributes.  
 		- `to_json`(indent=4): Serializes the object to a JSON formatted string.  
 		- `to_WKT`(precision=6): Returns the Well-Known Text (WKT) representation of the point.  
 	"""
+	__slots__ = ('_data', '_code_length', '_radians')
+
 	def __init__(self, data=None, code_length=10):
 		"""
 		Initializes a Point object.
@@ -347,8 +694,9 @@ class Point:
 		Raises:
 		- **TypeError**: If data is not a dictionary.
 		"""
-		self._data = none_dict(POINT)
+		self._data = _POINT_TEMPLATE.copy()
 		self._code_length = code_length
+		self._radians = None
 
 		if data is not None:
 			if isinstance(data, dict):
@@ -357,11 +705,10 @@ class Point:
 			
 			self._data['latitude'], self._data['longitude'] = latlon(data)
 
-			if self.latitude is not None and self.longitude is not None:
-				self._data['plus_code'] = encode(
-					self.latitude, self.longitude, 
-					codeLength=self._code_length
-				)
+			# The Plus Code is derived from the coordinates on first access (see `plus_code`), 
+			# a code copied from `data` may not match them (or the code length) and is dropped
+			if self._data['plus_code'] is not None and self.latitude is not None and self.longitude is not None:
+				self._data['plus_code'] = None
 
 	#--------------------------------------------------------------------------
 	# Magic methods
@@ -406,6 +753,8 @@ class Point:
 		"""
 		Returns the data dictionary containing all attributes.
 		"""
+		self.plus_code
+
 		return self._data
 
 	@data.setter
@@ -477,6 +826,15 @@ class Point:
 		Returns the latitude of the point.
 		"""
 		return self._data.get('latitude', None)
+
+	@latitude.setter
+	def latitude(self, value):
+		"""
+		Sets the latitude of the point.
+		"""
+		self._data['latitude'] = value
+		self._data['plus_code'] = None
+		self._radians = None
 	
 	@property
 	def longitude(self):
@@ -485,6 +843,15 @@ class Point:
 		"""
 		return self._data.get('longitude', None)
 
+	@longitude.setter
+	def longitude(self, value):
+		"""
+		Sets the longitude of the point.
+		"""
+		self._data['longitude'] = value
+		self._data['plus_code'] = None
+		self._radians = None
+
 	@property
 	def coordinates(self):
 		"""
@@ -504,14 +871,25 @@ class Point:
 		"""
 		Sets the length of the Plus Code.
 		"""
+		if code_length != self._code_length and self.latitude is not None and self.longitude is not None:
+			self._data['plus_code'] = None
+
 		self._code_length = code_length
 
 	@property
 	def plus_code(self):
 		"""
-		Returns the Plus Code representation of the point.
+		Returns the Plus Code representation of the point, encoded on first access.
 		"""
-		return self._data.get('plus_code', None)
+		code = self._data.get('plus_code', None)
+
+		if code is None and self.latitude is not None and self.longitude is not None:
+			code = self._data['plus_code'] = encode(
+				self.latitude, self.longitude, 
+				codeLength=self._code_length
+			)
+
+		return code
 
 	#--------------------------------------------------------------------------
 	# Basic Transformations
@@ -538,15 +916,38 @@ class Point:
 		Calculates the Haversine distance between this point and another.
 
 		Args:  
-		- **other (Point)**: The other point to calculate the distance to.
+		- **other (Point, PointView, PointArray, list)**: The other point (any object with scalar `latitude` and `longitude`), 
+		or several points, to calculate the distance to.
 
 		Returns:  
-		- **float**: The distance in meters between the two points.
+		- **float, numpy.ndarray**: The distance in meters between the two points, 
+		or an array of distances if several points are given.
 		"""
-		from_ = (self.latitude, self.longitude)
-		to_   = (other.latitude, other.longitude)
+		if isinstance(other, Point):
+			return _haversine_from_radians(*self._get_radians(), *other._get_radians())
+
+		if isinstance(other, PointArray):
+			return distance_haversine_batch(self.latitude, self.longitude, other.latitude, other.longitude)
 
-		return distance_haversine(from_, to_)
+		lat2 = getattr(other, 'latitude', None)
+		if lat2 is not None and numpy.ndim(lat2) == 0:
+			return _haversine_core(self.latitude, self.longitude, lat2, other.longitude)
+
+		lat2 = numpy.array([p.latitude  for p in other], dtype=numpy.float64)
+		lon2 = numpy.array([p.longitude for p in other], dtype=numpy.float64)
+
+		return distance_haversine_batch(self.latitude, self.longitude, lat2, lon2)
+
+	def _get_radians(self):
+		lat, lon = self.latitude, self.longitude
+		r = self._radians
+
+		# `_data` may be replaced wholesale (e.g. by Place), so check the cache against the current coordinates
+		if r is None or r[0] != lat or r[1] != lon:
+			lat_r = radians(lat)
+			r = self._radians = (lat, lon, lat_r, radians(lon), cos(lat_r))
+
+		return r[2:]
 
 	#--------------------------------------------------------------------------
 	# IO methods (to / from other formats)
@@ -556,7 +957,7 @@ class Point:
 		"""
 		Returns the data dictionary containing all attributes.
 		"""
-		return self._data
+		return self.data
 
 	def to_json(self, indent=4) -> str:
 		"""
@@ -570,7 +971,7 @@ class Point:
 		Returns:
 		- **str**: JSON representation of this object.
 		"""
-		return json.dumps(self._data, indent=indent)
+		return json.dumps(self.data, indent=indent)
 
 	def to_WKT(self, precision=6):
 		"""
@@ -583,6 +984,354 @@ class Point:
 		Returns:
 		- **str**: The WKT representation of the point.
 		"""
-		return 'POINT(%s %s)' % (round(self.longitude, precision), round(self.latitude, precision)) 
-	
-#EOF
\ No newline at end of file
+		return f'POINT({self.longitude:.{precision}f} {self.latitude:.{precision}f})'
+
+def _as_column(values):
+	# strings are stored as objects, so that any value (of any length, or None) can be written back through a PointView
+	column = numpy.asarray(values)
+
+	return column.astype(object) if column.dtype.kind in 'US' else column
+
+def _json_value(value):
+	# NaN and infinities are not valid JSON, they are written as null (as orjson does)
+	if isinstance(value, float):
+		return value if isfinite(value) else None
+	if isinstance(value, numpy.generic):
+		return _json_value(value.item())
+	if isinstance(value, dict):
+		return {k: _json_value(v) for k, v in value.items()}
+	if isinstance(value, (list, tuple)):
+		return [_json_value(v) for v in value]
+	if isinstance(value, numpy.ndarray):
+		return _json_value(value.tolist())
+	return value
+
+class PointArray:
+	"""
+	Represents a collection of geographic points stored column-wise (one NumPy array per attribute).
+
+	Attributes:  
+		- `latitude`(numpy.ndarray): Latitude coordinates of the points.  
+		- `longitude`(numpy.ndarray): Longitude coordinates of the points.  
+		- `columns`(dict): Additional attributes (`id`, `name`, `plus_code`, ...) as arrays of the same length.  
+
+	Methods:  
+		- `__init__`(latitude, longitude, **columns): Initializes a PointArray object.  
+		- `from_points`(points): Builds a PointArray from a list of Point objects.  
+		- `__len__`(): Returns the number of points.  
+		- `__getitem__`(i): Returns a `PointView` on the i-th point, or a `PointArray` on a slice, without copying.  
+		- `__iter__`(): Iterates over the points as `PointView` objects.  
+		- `coordinates`: Returns an array of shape `(N, 2)` of latitude and longitude coordinates.  
+		- `distance_matrix`(other=None): Calculates the Haversine distance matrix to another PointArray (or to itself).  
+		- `to_wkt`(precision=6): Returns the Well-Known Text (WKT) representations of the points.  
+		- `to_ndjson`(): Serializes the points to a newline-delimited JSON string.  
+		- `to_geodataframe`(crs='EPSG:4326'): Converts the points to a GeoDataFrame.  
+	"""
+	__slots__ = ('_lat', '_lon', '_columns')
+
+	def __init__(self, latitude, longitude, **columns):
+		"""
+		Initializes a PointArray object.
+
+		Args:
+		- **latitude (array-like)**: Latitudes in degrees.
+		- **longitude (array-like)**: Longitudes in degrees.
+		- **columns (array-like, optional)**: Additional attributes, one array per keyword.
+
+		Raises:
+		- **ValueError**: If the arrays do not all have the same length.
+		"""
+		self._lat = numpy.ascontiguousarray(latitude , dtype=numpy.float64)
+		self._lon = numpy.ascontiguousarray(longitude, dtype=numpy.float64)
+		self._columns = {k: _as_column(v) for k, v in columns.items()}
+
+		n = len(self._lat)
+		if len(self._lon) != n or any(len(v) != n for v in self._columns.values()):
+			raise ValueError('All columns of a PointArray must have the same length.')
+
+	@classmethod
+	def from_points(cls, points):
+		"""
+		Builds a PointArray from a list of Point objects.
+
+		Args:
+		- **points (list)**: The list of Point objects.
+
+		Returns:
+		- **PointArray**: The points stored column-wise.
+		"""
+		columns = {k: [p.data.get(k, None) for p in points] for k in POINT if k not in ('latitude', 'longitude', 'geometry')}
+
+		return cls(
+			[p.latitude  for p in points], 
+			[p.longitude for p in points], 
+			**columns
+		)
+
+	#--------------------------------------------------------------------------
+	# Magic methods
+	#--------------------------------------------------------------------------
+
+	def __repr__(self) -> str:
+		"""
+		Returns a string representation of the PointArray object.
+		"""
+		return '<{} of {} points>'.format(self.__class__.__name__, len(self))
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of points.
+		"""
+		return len(self._lat)
+
+	def __getitem__(self, i):
+		"""
+		Returns a `PointView` on the i-th point, or a `PointArray` on a slice, without copying 
+		(a slice with a step is copied, the arrays must stay contiguous).
+		"""
+		if isinstance(i, slice):
+			return PointArray(self._lat[i], self._lon[i], **{k: v[i] for k, v in self._columns.items()})
+
+		n = len(self)
+		if i < 0:
+			i += n
+		if not 0 <= i < n:
+			raise IndexError('PointArray index out of range')
+
+		return PointView(self, i)
+
+	def __iter__(self):
+		"""
+		Iterates over the points as `PointView` objects.
+		"""
+		for i in range(len(self)):
+			yield PointView(self, i)
+
+	#--------------------------------------------------------------------------
+	# Getters & Setters
+	#--------------------------------------------------------------------------
+
+	@property
+	def latitude(self):
+		"""
+		Returns the latitudes of the points.
+		"""
+		return self._lat
+
+	@property
+	def longitude(self):
+		"""
+		Returns the longitudes of the points.
+		"""
+		return self._lon
+
+	@property
+	def columns(self):
+		"""
+		Returns the additional attributes of the points.
+		"""
+		return self._columns
+
+	@property
+	def coordinates(self):
+		"""
+		Returns an array of shape `(N, 2)` of latitude and longitude coordinates.
+		"""
+		return numpy.stack([self._lat, self._lon], axis=-1)
+
+	#--------------------------------------------------------------------------
+	# Computational tools
+	#--------------------------------------------------------------------------
+
+	def distance_matrix(self, other=None):
+		"""
+		Calculates the Haversine distance matrix between these points and another set of points.
+
+		Args:  
+		- **other (PointArray, optional)**: The destination points. Defaults to None (the points themselves).
+
+		Returns:  
+		- **numpy.ndarray**: An array of shape `(N, M)` of distances in meters.
+		"""
+		if other is None:
+			other = self
+
+		return haversine_matrix(self, other)
+
+	#--------------------------------------------------------------------------
+	# IO methods (to / from other formats)
+	#--------------------------------------------------------------------------
+
+	def to_wkt(self, precision=6):
+		"""
+		Returns the Well-Known Text (WKT) representations of the points.
+
+		Args:
+		- **precision(int, optional)**: the number of decimal places to round the coordinates to.   
+		Defaults to 6.
+
+		Returns:
+		- **numpy.ndarray**: The WKT representations of the points.
+		"""
+		fmt = f'%.{precision}f'
+		lon = numpy.char.mod(fmt, self._lon)
+		lat = numpy.char.mod(fmt, self._lat)
+
+		wkt = numpy.char.add(numpy.char.add('POINT(', lon), ' ')
+		wkt = numpy.char.add(numpy.char.add(wkt, lat), ')')
+
+		return wkt.astype(object)
+
+	def to_ndjson(self) -> str:
+		"""
+		Serializes the points to a newline-delimited JSON (NDJSON) string, one object per point.
+
+		Returns:
+		- **str**: NDJSON representation of the points.
+		"""
+		keys = ['latitude', 'longitude', *self._columns]
+		cols = [self._lat.tolist(), self._lon.tolist(), *(v.tolist() for v in self._columns.values())]
+		rows = (dict(zip(keys, values)) for values in zip(*cols))
+
+		if orjson is not None:
+			return b'\n'.join(orjson.dumps(row, option=orjson.OPT_SERIALIZE_NUMPY) for row in rows).decode()
+
+		return '\n'.join(json.dumps(_json_value(row), ensure_ascii=False, allow_nan=False, separators=(',', ':')) for row in rows)
+
+	def to_geodataframe(self, crs='EPSG:4326'):
+		"""
+		Converts the points to a GeoDataFrame.
+
+		Args:
+		- **crs (str, optional)**: The coordinate reference system. Defaults to 'EPSG:4326'.
+
+		Returns:
+		- **geopandas.GeoDataFrame**: One row per point, with the additional attributes as columns.
+		"""
+		import geopandas
+
+		data = {'latitude': self._lat, 'longitude': self._lon, **self._columns}
+
+		return geopandas.GeoDataFrame(
+			data, 
+			geometry=geopandas.points_from_xy(self._lon, self._lat), 
+			crs=crs
+		)
+
+class PointView:
+	"""
+	Represents a single point of a `PointArray`, reading its values from the parent arrays without copying.
+
+	Methods:  
+		- `__getitem__`(key): Allows accessing attributes as dictionary keys.  
+		- `__setitem__`(key, value): Writes an attribute through to the parent arrays.  
+		- `latitude`: Returns or sets the latitude of the point.  
+		- `longitude`: Returns or sets the longitude of the point.  
+		- `coordinates`: Returns a tuple of latitude and longitude coordinates.  
+		- `to_dict`(): Returns a dictionary containing all attributes.  
+		- `to_point`(): Returns a `Point` object with the same attributes.  
+	"""
+	__slots__ = ('_parent', '_index')
+
+	def __init__(self, parent, index):
+		"""
+		Initializes a PointView object.
+
+		Args:
+		- **parent (PointArray)**: The PointArray the point belongs to.
+		- **index (int)**: The position of the point in the parent.
+		"""
+		self._parent = parent
+		self._index  = index
+
+	def __repr__(self) -> str:
+		"""
+		Returns a string representation of the PointView object.
+		"""
+		return '<{} {}>'.format(self.__class__.__name__, self._index)
+
+	def __getitem__(self, key):
+		"""
+		Allows accessing attributes as dictionary keys.
+		"""
+		if key == 'latitude':
+			return self.latitude
+		if key == 'longitude':
+			return self.longitude
+
+		v = self._parent._columns[key][self._index]
+
+		return v.item() if isinstance(v, numpy.generic) else v
+
+	def __setitem__(self, key, value):
+		"""
+		Writes an attribute through to the parent arrays.
+		"""
+		if key == 'latitude':
+			self.latitude = value
+		elif key == 'longitude':
+			self.longitude = value
+		else:
+			self._parent._columns[key][self._index] = value
+
+	@property
+	def latitude(self):
+		"""
+		Returns the latitude of the point.
+		"""
+		return float(self._parent._lat[self._index])
+
+	@latitude.setter
+	def latitude(self, value):
+		"""
+		Sets the latitude of the point.
+		"""
+		self._parent._lat[self._index] = value
+		self._reset_plus_code()
+
+	@property
+	def longitude(self):
+		"""
+		Returns the longitude of the point.
+		"""
+		return float(self._parent._lon[self._index])
+
+	@longitude.setter
+	def longitude(self, value):
+		"""
+		Sets the longitude of the point.
+		"""
+		self._parent._lon[self._index] = value
+		self._reset_plus_code()
+
+	def _reset_plus_code(self):
+		# as in Point, moving the point invalidates its plus code (encoded again by `to_point`)
+		codes = self._parent._columns.get('plus_code', None)
+		if codes is not None:
+			codes[self._index] = None
+
+	@property
+	def coordinates(self):
+		"""
+		Returns a tuple of latitude and longitude coordinates.
+		"""
+		return (self.latitude, self.longitude)
+
+	def to_dict(self):
+		"""
+		Returns a dictionary containing all attributes.
+		"""
+		d = {k: v[self._index] for k, v in self._parent._columns.items()}
+		d = {k: v.item() if isinstance(v, numpy.generic) else v for k, v in d.items()}
+		d['latitude']  = self.latitude
+		d['longitude'] = self.longitude
+
+		return d
+
+	def to_point(self, code_length=10):
+		"""
+		Returns a `Point` object with the same attributes.
+		"""
+		return Point(self.to_dict(), code_length=code_length)
+
+#EOF
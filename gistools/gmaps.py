@@ -4,24 +4,367 @@ It handles authentication, setting API limits, and making API calls for retrievi
 
 * `get_api_key`: Retrieves the Google Maps API key from the specified file or environment variable.
 * `set_credentials`: Sets up the Google Maps API client with the specified credentials and limits.
+* `reload_credentials`: Forgets the cached API key(s) and reads the keyfile again.
 * `get_place_info`: Retrieves information about a place based on a given address.
+* `get_place_info_many`: Retrieves information about many places concurrently (asynchronous, requires aiohttp).
+* `get_place_info_many_sync`: Synchronous wrapper around `get_place_info_many`.
+* `get_place_info_batch`: Retrieves information about many places concurrently using a pool of threads.
+* `geocode_many`: Geocodes many addresses concurrently (asynchronous, requires aiohttp).
+* `cache_get`: Returns a cached API response.
+* `cache_set`: Stores an API response in the cache.
+* `PlaceInfo`: A compact, immutable record of the place information returned by the lookups above.
+
+**Constants:**
+* `DEFAULT_FIELDS`: Fields requested from the Places API by default.
 
 **Notes:**
 * This module depends on the [googlemaps](https://github.com/googlemaps/google-maps-services-python) and [requests](https://requests.readthedocs.io/en/latest/) Python packages.  
 * Ensure they are installed before using this module.  
 * Remember to [protect your Google Maps API key](https://developers.google.com/maps/api-security-best-practices) and avoid sharing it publicly.  
 * Be aware of the [Google Maps API usage limits and billing](https://developers.google.com/maps/billing-and-pricing/billing).  
+* Set `GISTOOLS_GMAPS_CACHE_DB` to a sqlite file path to keep place lookups across runs and avoid paying for them twice.  
 
-The get_place_info() function currently retrieves only basic place information. 
-You can modify it to retrieve more fields by adding them to the fields parameter in the request.
+The get_place_info() function retrieves only basic place information by default (see `DEFAULT_FIELDS`). 
+Pass the `fields` parameter to request other fields, and `raw=True` to read them from the decoded response.
 """
 import os
+import json
+import time
+import sqlite3
+import hashlib
+import random
+import asyncio
+import functools
+import threading
 import requests
 import googlemaps
 
+from types             import MappingProxyType
+from dataclasses       import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse      import urlencode, quote_plus
+from collections       import OrderedDict
+from datetime          import datetime, timezone
+from email.utils       import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util      import Retry
+
 from gistools.utils import read_json
 
-__all__ = ['set_credentials', 'get_api_key', 'get_place_info']
+try:
+	import aiohttp
+except ImportError: # aiohttp is optional, only needed by the asynchronous batch lookups
+	aiohttp = None
+
+try:
+	import httpx
+except ImportError: # httpx is optional, only needed by the HTTP/2 backend
+	httpx = None
+
+try:
+	import orjson
+	_loads = orjson.loads
+	_dumps = orjson.dumps
+except ImportError: # orjson is optional, JSON falls back to the standard library
+	_loads = json.loads
+	_dumps = lambda obj: json.dumps(obj).encode()
+
+__all__ = ['DEFAULT_FIELDS', 'set_credentials', 'reload_credentials', 'get_api_key', 'get_place_info', 'get_place_info_many', 'get_place_info_many_sync', 'get_place_info_batch', 'geocode_many', 'cache_get', 'cache_set', 'PlaceInfo']
+
+_PLACE_URL = "https://maps.googleapis.com/maps/api/place/findplacefromtext/json"
+""" Base URL of the Places API 'Find Place' endpoint."""
+
+_GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
+""" Base URL of the Geocoding API."""
+
+DEFAULT_FIELDS = ("formatted_address", "name", "business_status", "place_id")
+""" Fields requested from the Places API by default. Google bills per field category, request only what you need."""
+
+_BASE_PARAMS = MappingProxyType({"inputtype": "textquery"})
+""" Read-only query parameters shared by every 'Find Place' request, only `input`, `fields` and `key` vary per call."""
+
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+""" HTTP status codes on which a request is retried (rate limited or transient server errors)."""
+
+_TIMEOUT = (3.05, 10)
+""" (connect, read) timeouts in seconds applied to every request, so a hung connection cannot stall a batch."""
+
+_MAX_ATTEMPTS = 5
+""" The maximum number of attempts per request in the asynchronous batch lookups."""
+
+_MAX_BACKOFF = 60.0
+""" The maximum delay in seconds before retrying a request, whatever the `Retry-After` header asks for."""
+
+_INIT_LOCK = threading.Lock()
+""" Guards the lazy creation of the module-level session, httpx client and disk cache, which worker threads may request at once."""
+
+_SESSION = None
+""" HTTP session shared by all calls, so connections to the API are kept alive and reused (see `_get_session`)."""
+
+@dataclass(frozen=True)
+class PlaceInfo:
+	"""
+	Represents the place information returned by the Places API 'Find Place' endpoint (first candidate only).
+
+	Attributes:  
+		- `formatted_address`(str): The address of the place.  
+		- `name`(str): The name of the place.  
+		- `business_status`(str): The operational status of the place, if it is a business.  
+		- `place_id`(str): The unique identifier of the place.  
+		- `status`(str): The status of the request (e.g. 'OK', 'ZERO_RESULTS').  
+	"""
+	__slots__ = ('formatted_address', 'name', 'business_status', 'place_id', 'status')
+
+	formatted_address: str
+	name: str
+	business_status: str
+	place_id: str
+	status: str
+
+	@classmethod
+	def from_response(cls, payload):
+		"""
+		Builds a PlaceInfo from a decoded API response.
+
+		Args:
+		- **payload (dict)**: The decoded JSON response.
+
+		Returns:
+		- **PlaceInfo**: The information of the first candidate, or None attributes if there is no candidate.
+		"""
+		candidates = payload.get('candidates') or [{}]
+		candidate  = candidates[0]
+
+		return cls(
+			candidate.get('formatted_address'), 
+			candidate.get('name'), 
+			candidate.get('business_status'), 
+			candidate.get('place_id'), 
+			payload.get('status')
+		)
+
+	def __reduce__(self):
+		# Frozen slotted instances cannot be restored attribute by attribute, rebuild them from their fields
+		return (self.__class__, tuple(getattr(self, k) for k in self.__slots__))
+
+def _to_result(data, raw=False):
+	if raw or not isinstance(data, dict):
+		return data
+
+	return PlaceInfo.from_response(data)
+
+class _TTLCache:
+	"""
+	Thread-safe in-memory LRU cache whose entries expire `ttl` seconds after being stored.
+	"""
+	def __init__(self, maxsize=4096, ttl=3600):
+		self.maxsize = maxsize
+		self.ttl     = ttl
+		self._data   = OrderedDict()
+		self._lock   = threading.Lock()
+
+	def get(self, key):
+		with self._lock:
+			item = self._data.get(key)
+
+			if item is None:
+				return None
+			if time.monotonic() - item[0] >= self.ttl:
+				del self._data[key]
+				return None
+
+			self._data.move_to_end(key)
+			return item[1]
+
+	def set(self, key, value):
+		with self._lock:
+			self._data[key] = (time.monotonic(), value)
+			self._data.move_to_end(key)
+
+			while len(self._data) > self.maxsize:
+				self._data.popitem(last=False)
+
+	def clear(self):
+		with self._lock:
+			self._data.clear()
+
+_PLACE_CACHE = _TTLCache(maxsize=4096, ttl=int(os.getenv('GISTOOLS_GMAPS_TTL', '3600')))
+""" Cached API responses, serialized and keyed by `_namespaced_key` (see `cache_get`). The TTL (in seconds) is read from `GISTOOLS_GMAPS_TTL`, defaults to 1 hour."""
+
+class _DiskCache:
+	"""
+	Persistent cache stored in a sqlite database, shared across processes. Entries expire `ttl` seconds after being stored.
+	"""
+	def __init__(self, path, ttl=7*24*3600):
+		self.ttl   = ttl
+		self._lock = threading.Lock()
+		self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+		self._conn.execute("CREATE TABLE IF NOT EXISTS places (key TEXT PRIMARY KEY, ts INTEGER, payload BLOB)")
+
+	@staticmethod
+	def _hash(key):
+		return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+	def get(self, key):
+		with self._lock:
+			row = self._conn.execute(
+				"SELECT payload FROM places WHERE key=? AND ts>?", 
+				(self._hash(key), int(time.time() - self.ttl))
+			).fetchone()
+
+		return row[0] if row is not None else None
+
+	def set(self, key, payload):
+		with self._lock:
+			self._conn.execute(
+				"INSERT OR REPLACE INTO places (key, ts, payload) VALUES (?, ?, ?)", 
+				(self._hash(key), int(time.time()), payload)
+			)
+
+	def clear(self):
+		with self._lock:
+			self._conn.execute("DELETE FROM places")
+
+_DISK_CACHE = None
+""" Persistent cache of `get_place_info` responses, enabled by setting `GISTOOLS_GMAPS_CACHE_DB` to a sqlite file path (see `_get_disk_cache`)."""
+
+def _get_disk_cache():
+	global _DISK_CACHE
+
+	if _DISK_CACHE is None:
+		path = os.getenv('GISTOOLS_GMAPS_CACHE_DB')
+
+		if path:
+			with _INIT_LOCK:
+				if _DISK_CACHE is None:
+					_DISK_CACHE = _DiskCache(path, ttl=int(os.getenv('GISTOOLS_GMAPS_CACHE_TTL', str(7*24*3600))))
+
+	return _DISK_CACHE
+
+def cache_get(namespace, key):
+	"""
+	Returns a response stored with `cache_set`, from memory or from the sqlite cache if `GISTOOLS_GMAPS_CACHE_DB` is set.
+
+	Args:
+	- **namespace (str)**: The kind of call the response comes from, e.g. 'geocode'. Keys of different namespaces never collide.
+	- **key (tuple)**: The arguments identifying the call, made of JSON serializable values.
+
+	Returns:
+	- **dict, list**: A fresh copy of the stored response, or None if there is none (or it has expired).
+	"""
+	return _cache_get(_namespaced_key(namespace, key))
+
+def cache_set(namespace, key, data):
+	"""
+	Stores a response in the cache, in memory and in the sqlite cache if `GISTOOLS_GMAPS_CACHE_DB` is set.  
+	The response is serialized, so later changes to `data` do not alter the cached copy.
+
+	Args:
+	- **namespace (str)**: The kind of call the response comes from, e.g. 'geocode'.
+	- **key (tuple)**: The arguments identifying the call, made of JSON serializable values.
+	- **data (dict, list)**: The decoded JSON response.
+	"""
+	_cache_set(_namespaced_key(namespace, key), data)
+
+def _namespaced_key(namespace, key):
+	# a JSON dump is unambiguous, whatever the values contain (unlike joining them with a separator)
+	return json.dumps([namespace, *key], ensure_ascii=False, separators=(',', ':'))
+
+def _cache_get(key):
+	payload = _PLACE_CACHE.get(key)
+
+	if payload is None:
+		disk = _get_disk_cache()
+
+		if disk is not None:
+			payload = disk.get(key)
+
+			if payload is not None:
+				_PLACE_CACHE.set(key, payload)
+
+	return _loads(payload) if payload is not None else None
+
+def _cache_set(key, data):
+	payload = _dumps(data)
+
+	_PLACE_CACHE.set(key, payload)
+
+	disk = _get_disk_cache()
+	if disk is not None:
+		disk.set(key, payload)
+
+_CACHEABLE_STATUSES = ('OK', 'ZERO_RESULTS')
+""" API statuses whose responses are cached. Errors such as 'OVER_QUERY_LIMIT' or 'REQUEST_DENIED' come with HTTP 200 and must not be replayed."""
+
+def _is_cacheable(data):
+	return isinstance(data, dict) and data.get('status') in _CACHEABLE_STATUSES
+
+def _cache_clear():
+	_PLACE_CACHE.clear()
+
+	disk = _get_disk_cache()
+	if disk is not None:
+		disk.clear()
+
+def _get_session():
+	"""
+	Returns the module-level `requests.Session`, creating it on first use.
+
+	Returns:
+	- **requests.Session**: A session with a pooled, retrying adapter mounted on `https://`.
+	"""
+	global _SESSION
+
+	if _SESSION is None:
+		with _INIT_LOCK:
+			if _SESSION is None:
+				retry = Retry(
+					total=5, 
+					backoff_factor=0.5, 
+					status_forcelist=_RETRY_STATUSES, 
+					allowed_methods=frozenset(['GET']), 
+					respect_retry_after_header=True, 
+					raise_on_status=False # Once the retries are exhausted, return the last response instead of raising
+				)
+
+				session = requests.Session()
+				session.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry))
+
+				_SESSION = session
+
+	return _SESSION
+
+_HTTPX_CLIENT = None
+""" HTTP/2 client shared by all calls made with `backend='httpx'` (see `_get_httpx_client`)."""
+
+def _get_httpx_client():
+	"""
+	Returns the module-level `httpx.Client`, creating it on first use.  
+	Requests to the API are multiplexed over HTTP/2, which requires the `h2` package (`pip install httpx[http2]`).
+
+	Returns:
+	- **httpx.Client**: An HTTP/2 client with pooled connections, timeouts and retries on connection errors.  
+	Rate limited and transient server errors are retried by `_http_get`, as with the requests session.
+
+	Raises:
+	- **ImportError**: If httpx (or h2) is not installed.
+	"""
+	global _HTTPX_CLIENT
+
+	if _HTTPX_CLIENT is None:
+		if httpx is None:
+			raise ImportError("Oops! The 'httpx' backend requires the httpx package.")
+
+		with _INIT_LOCK:
+			if _HTTPX_CLIENT is None:
+				limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+				_HTTPX_CLIENT = httpx.Client(
+					transport=httpx.HTTPTransport(http2=True, limits=limits, retries=3), # retries failed connections
+					timeout=httpx.Timeout(_TIMEOUT[1], connect=_TIMEOUT[0])
+				)
+
+	return _HTTPX_CLIENT
 
 def get_api_key(keyfile=None):
 	"""
@@ -35,12 +378,58 @@ def get_api_key(keyfile=None):
 	Returns:
 	- **str**: The Google Maps API key as a string, or None if the key is not found.
 	"""
-	if keyfile is None:
-		keyfile = os.getenv('GISTOOLS_GMAPS_KEY_FILE')
-		
+	return _api_key(keyfile)
+
+def reload_credentials(keyfile=None):
+	"""
+	Forgets the cached API key(s) and reads the keyfile again, e.g. after the key has been rotated.
+
+	Args:
+	- **keyfile (str, optional)**: The path to a JSON file containing the API key.  
+	If not provided, the environment variable `GISTOOLS_GMAPS_KEY_FILE` will be used.
+	Defaults to None.
+
+	Returns:
+	- **str**: The Google Maps API key as a string, or None if the key is not found.
+	"""
+	global _API_KEY
+
+	with _API_KEY_LOCK:
+		_API_KEY = None
+		_load_api_key.cache_clear()
+		_url_builder.cache_clear()
+
+	return _api_key(keyfile)
+
+_API_KEY = None
+""" API key read from the keyfile named by `GISTOOLS_GMAPS_KEY_FILE`, resolved once on first use (see `_api_key`)."""
+
+_API_KEY_LOCK = threading.Lock()
+
+def _api_key(keyfile=None):
+	global _API_KEY
+
+	if keyfile is not None:
+		return _load_api_key(keyfile)
+
+	if _API_KEY is None:
+		with _API_KEY_LOCK:
+			if _API_KEY is None:
+				keyfile = os.getenv('GISTOOLS_GMAPS_KEY_FILE')
+
+				if keyfile is None:
+					raise ValueError("Oops! No keyfile given and the GISTOOLS_GMAPS_KEY_FILE environment variable is not set.")
+
+				_API_KEY = _load_api_key(keyfile)
+
+	return _API_KEY
+
+@functools.lru_cache(maxsize=8)
+def _load_api_key(keyfile):
+	# The keyfile is read and parsed once per path, see `reload_credentials` to force a re-read
 	return read_json(keyfile).get('api_key', None)
 
-def set_credentials(keyfile=None, queries_per_minute=3000, queries_per_second=None, retry_over_query_limit=True):
+def set_credentials(keyfile=None, queries_per_minute=3000, queries_per_second=None, retry_over_query_limit=True, pool_connections=32, pool_maxsize=128):
 	"""
 	Sets up the Google Maps API client with the specified credentials and limits.
 
@@ -54,46 +443,392 @@ def set_credentials(keyfile=None, queries_per_minute=3000, queries_per_second=No
 	Defaults to None, which means the limit is not set.
 	- **retry_over_query_limit (bool, optional)**: If True, the client will automatically retry requests that exceed the query limit.  
 	Defaults to True.
+	- **pool_connections (int, optional)**: The number of connection pools to cache in the client's HTTP session.  
+	Defaults to 32.
+	- **pool_maxsize (int, optional)**: The maximum number of connections kept alive per pool.  
+	Should be at least the number of threads sharing the client. Defaults to 128.
 
 	Returns:
 	- **googlemaps.Client**: A `googlemaps.Client` object, ready to be used for making API calls.
 	"""
-	if  keyfile is None:
-		keyfile  = os.getenv('GISTOOLS_GMAPS_KEY_FILE')
-
-	return googlemaps.Client(
-		key=read_json(keyfile).get('api_key', None),
+	client = googlemaps.Client(
+		key=_api_key(keyfile),
 		queries_per_minute=queries_per_minute,
 		queries_per_second=queries_per_second,
-		retry_over_query_limit=retry_over_query_limit
+		retry_over_query_limit=retry_over_query_limit,
+		connect_timeout=_TIMEOUT[0],
+		read_timeout=_TIMEOUT[1]
 	)
 
-def get_place_info(address, api_key):
+	adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+	client.session.mount('https://', adapter)
+	client.session.mount('http://' , adapter)
+
+	return client
+
+def get_place_info(address, api_key, fields=DEFAULT_FIELDS, backend='requests', raw=False):
 	"""
 	Retrieves information about a place based on a given address using the Google Maps Places API.
 
 	Args:
 	- **address (str)**: The address to search for.
 	- **api_key (str)**: The Google Maps API key.
+	- **fields (tuple, str, optional)**: The fields to request, as a tuple of names or a comma-separated string.  
+	Defaults to `DEFAULT_FIELDS`.
+	- **backend (str, optional)**: The HTTP client, either 'requests' (HTTP/1.1) or 'httpx' (HTTP/2, requires httpx and h2).  
+	Defaults to 'requests'.
+	- **raw (bool, optional)**: If True, returns the decoded JSON response instead of a `PlaceInfo`, e.g. to read other fields.  
+	Defaults to False.
 
 	Returns:
-	- **dict**: A dictionary containing the place information if the request was successful, or None if there was an error.
-	"""
-	base_url = "https://maps.googleapis.com/maps/api/place/findplacefromtext/json"
-	""" Base URL """
-
-	params = {
-		"input": address,
-		"inputtype": "textquery",
-		"fields": "formatted_address,name,business_status,place_id",
-		"key": api_key,
-	}
-	""" Parameters in a dictionary """
-
-	response = requests.get(base_url, params=params) # Send request and capture response
-	if response.status_code == 200: # Check if the request was successful
-		return response.json()
+	- **PlaceInfo, dict**: The place information if the request was successful, or None if there was an error.
+
+	Notes:
+	- Successful responses (status 'OK' or 'ZERO_RESULTS') are cached in memory for `GISTOOLS_GMAPS_TTL` seconds (1 hour by default).  
+	- If `GISTOOLS_GMAPS_CACHE_DB` is set, they are also stored in that sqlite file, shared across processes, 
+	for `GISTOOLS_GMAPS_CACHE_TTL` seconds (7 days by default).  
+	Call `get_place_info.cache_clear()` to empty the caches.
+
+	Raises:
+	- **ValueError**: If the backend is unknown.
+	"""
+	fields = _join_fields(fields)
+
+	key  = _cache_key(address, fields)
+	data = _cache_get(key)
+	if data is not None:
+		return _to_result(data, raw)
+
+	content = _http_get(_url_builder(api_key, fields).url(address), backend) # Send request and capture response body
+	if content is not None: # Check if the request was successful
+		data = _loads(content)
+		if _is_cacheable(data):
+			_cache_set(key, data)
+		return _to_result(data, raw)
 	else:
 		return None
 
+get_place_info.cache_clear = _cache_clear
+
+async def get_place_info_many(addresses, api_key, fields=DEFAULT_FIELDS, concurrency=10, queries_per_second=10, raw=False):
+	"""
+	Retrieves information about many places concurrently using the Google Maps Places API.  
+	All requests share one `aiohttp.ClientSession`, at most `concurrency` of them are in flight at once, 
+	and a token bucket keeps the request rate under `queries_per_second`. Rate limited (429) and 
+	transient server errors are retried with exponential backoff, honoring the `Retry-After` header.
+	Duplicate addresses (after normalization) are looked up once.
+
+	Args:
+	- **addresses (list)**: The addresses to search for.
+	- **api_key (str)**: The Google Maps API key.
+	- **fields (tuple, str, optional)**: The fields to request, as a tuple of names or a comma-separated string.  
+	Defaults to `DEFAULT_FIELDS`.
+	- **concurrency (int, optional)**: The maximum number of simultaneous requests. Defaults to 10.
+	- **queries_per_second (float, optional)**: The maximum number of requests sent per second.  
+	Defaults to 10, None means no rate limit.
+	- **raw (bool, optional)**: If True, returns the decoded JSON responses instead of `PlaceInfo` objects. Defaults to False.
+
+	Returns:
+	- **list**: One result per address, in the same order: the place information, 
+	None if the request was unsuccessful, or the exception raised by the request.
+
+	Raises:
+	- **ImportError**: If aiohttp is not installed.
+	"""
+	if aiohttp is None:
+		raise ImportError("Oops! get_place_info_many requires the aiohttp package.")
+
+	fields    = _join_fields(fields)
+	builder   = _url_builder(api_key, fields)
+	semaphore = asyncio.Semaphore(concurrency)
+	limiter   = _TokenBucket(queries_per_second) if queries_per_second else None
+
+	async with _client_session(concurrency) as session:
+		async def fetch(address, key):
+			data = _cache_get(key)
+			if data is not None:
+				return data
+
+			data = await _fetch_json(session, builder.url(address), semaphore, limiter)
+			if _is_cacheable(data):
+				_cache_set(key, data)
+
+			return data
+
+		# Single-flight: duplicate addresses (same cache key) share one task, hence one request
+		inflight = {}
+		tasks    = []
+
+		for address in addresses:
+			key = _cache_key(address, fields)
+
+			if key not in inflight:
+				inflight[key] = asyncio.ensure_future(fetch(address, key))
+
+			tasks.append(inflight[key])
+
+		results = await asyncio.gather(*tasks, return_exceptions=True)
+
+	return [_to_result(data, raw) for data in results]
+
+def get_place_info_many_sync(addresses, api_key, fields=DEFAULT_FIELDS, concurrency=10, queries_per_second=10, raw=False):
+	"""
+	Retrieves information about many places concurrently, from synchronous code.  
+	Runs `get_place_info_many` in a new event loop, so it cannot be called from a running loop.
+
+	Args:
+	- **addresses (list)**: The addresses to search for.
+	- **api_key (str)**: The Google Maps API key.
+	- **fields (tuple, str, optional)**: The fields to request, as a tuple of names or a comma-separated string.  
+	Defaults to `DEFAULT_FIELDS`.
+	- **concurrency (int, optional)**: The maximum number of simultaneous requests. Defaults to 10.
+	- **queries_per_second (float, optional)**: The maximum number of requests sent per second.  
+	Defaults to 10, None means no rate limit.
+	- **raw (bool, optional)**: If True, returns the decoded JSON responses instead of `PlaceInfo` objects. Defaults to False.
+
+	Returns:
+	- **list**: One result per address, in the same order (see `get_place_info_many`).
+	"""
+	return asyncio.run(get_place_info_many(
+		addresses, api_key, 
+		fields=fields, 
+		concurrency=concurrency, 
+		queries_per_second=queries_per_second, 
+		raw=raw
+	))
+
+def get_place_info_batch(addresses, api_key, fields=DEFAULT_FIELDS, workers=16, queries_per_second=None, backend='requests', raw=False):
+	"""
+	Retrieves information about many places concurrently, using a pool of threads over the shared HTTP session.  
+	An alternative to `get_place_info_many` for callers that cannot use asyncio.
+
+	Args:
+	- **addresses (list)**: The addresses to search for.
+	- **api_key (str)**: The Google Maps API key.
+	- **fields (tuple, str, optional)**: The fields to request, as a tuple of names or a comma-separated string.  
+	Defaults to `DEFAULT_FIELDS`.
+	- **workers (int, optional)**: The number of threads. Defaults to 16.  
+	The shared session keeps up to 64 connections alive, more workers would wait for a free connection.
+	- **queries_per_second (float, optional)**: The maximum number of requests sent per second.  
+	Defaults to None, which means the rate is not limited.
+	- **backend (str, optional)**: The HTTP client, either 'requests' or 'httpx' (see `get_place_info`).  
+	With 'httpx', the threads multiplex their requests over HTTP/2 connections. Defaults to 'requests'.
+	- **raw (bool, optional)**: If True, returns the decoded JSON responses instead of `PlaceInfo` objects. Defaults to False.
+
+	Returns:
+	- **list**: One result per address, in the same order: the place information, 
+	None if the request was unsuccessful, or the exception raised by the request (see `get_place_info_many`).  
+	Duplicate addresses (after normalization) are looked up once.
+	"""
+	fields  = _join_fields(fields)
+	limiter = _TokenBucket(queries_per_second) if queries_per_second else None
+
+	def fetch(address):
+		if limiter is not None and _cache_get(_cache_key(address, fields)) is None:
+			limiter.acquire_sync()
+
+		try:
+			return get_place_info(address, api_key, fields=fields, backend=backend, raw=raw)
+		except Exception as e: # One failed request (timeout, connection error...) must not lose the whole batch
+			return e
+
+	unique = {}
+	for address in addresses:
+		unique.setdefault(_cache_key(address, fields), address)
+
+	with ThreadPoolExecutor(max_workers=workers) as executor:
+		results = dict(zip(unique, executor.map(fetch, unique.values())))
+
+	return [results[_cache_key(address, fields)] for address in addresses]
+
+async def geocode_many(addresses, api_key, components=None, language=None, concurrency=10, queries_per_second=10):
+	"""
+	Geocodes many addresses concurrently using the Google Maps Geocoding API.  
+	Requests are sent as in `get_place_info_many`: one shared `aiohttp.ClientSession`, at most `concurrency` 
+	requests in flight, a token bucket rate limit and retries with exponential backoff.
+
+	Args:
+	- **addresses (list)**: The addresses to geocode.
+	- **api_key (str)**: The Google Maps API key.
+	- **components (dict, optional)**: Component filters applied to every address, e.g. `{'country': 'france'}`. Defaults to None.
+	- **language (str, optional)**: The language of the results. Defaults to None.
+	- **concurrency (int, optional)**: The maximum number of simultaneous requests. Defaults to 10.
+	- **queries_per_second (float, optional)**: The maximum number of requests sent per second.  
+	Defaults to 10, None means no rate limit.
+
+	Returns:
+	- **list**: One result per address, in the same order: the list of geocoding results (as returned by 
+	`googlemaps.Client.geocode`), None if the request was unsuccessful, or the exception raised by the request.
+
+	Raises:
+	- **ImportError**: If aiohttp is not installed.
+	"""
+	if aiohttp is None:
+		raise ImportError("Oops! geocode_many requires the aiohttp package.")
+
+	params = {"key": api_key}
+	if components:
+		params["components"] = '|'.join('%s:%s' % (k, v) for k, v in sorted(components.items()))
+	if language:
+		params["language"] = language
+
+	prefix    = _GEOCODE_URL + '?' + urlencode(params) + '&address='
+	semaphore = asyncio.Semaphore(concurrency)
+	limiter   = _TokenBucket(queries_per_second) if queries_per_second else None
+
+	async with _client_session(concurrency) as session:
+		async def fetch(address):
+			data = await _fetch_json(session, prefix + quote_plus(address), semaphore, limiter)
+
+			if data is None or data.get('status') not in ('OK', 'ZERO_RESULTS'):
+				return None
+
+			return data.get('results', [])
+
+		return await asyncio.gather(*[fetch(address) for address in addresses], return_exceptions=True)
+
+def _client_session(concurrency):
+	connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=concurrency, ttl_dns_cache=300)
+	timeout   = aiohttp.ClientTimeout(sock_connect=_TIMEOUT[0], sock_read=_TIMEOUT[1])
+
+	return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+async def _fetch_json(session, url, semaphore, limiter=None):
+	# Returns the decoded response if the status is 200, otherwise None. 
+	# Rate limited and transient server errors are retried up to `_MAX_ATTEMPTS` times.
+	for attempt in range(_MAX_ATTEMPTS):
+		async with semaphore:
+			if limiter is not None:
+				await limiter.acquire()
+
+			async with session.get(url) as response:
+				if response.status == 200:
+					return _loads(await response.read())
+				elif response.status not in _RETRY_STATUSES or attempt == _MAX_ATTEMPTS - 1:
+					return None
+
+				delay = _backoff(attempt, response.headers.get('Retry-After'))
+
+		await asyncio.sleep(delay) # Back off outside the semaphore, so other requests can proceed
+
+	return None
+
+class _TokenBucket:
+	"""
+	Token-bucket rate limiter: tokens refill continuously at `rate` per second, up to `capacity`, 
+	and each request consumes one token. Use `acquire` from coroutines and `acquire_sync` from threads.
+	"""
+	def __init__(self, rate, capacity=None):
+		self._rate     = float(rate)
+		self._capacity = float(capacity or max(rate, 1))
+		self._tokens   = self._capacity
+		self._last     = time.monotonic()
+		self._alock    = None # Created on first use, inside the running event loop
+		self._tlock    = threading.Lock()
+
+	def _take(self):
+		# Consumes a token if one is available, otherwise returns the time to wait for the next one
+		now = time.monotonic()
+		self._tokens = min(self._capacity, self._tokens + (now - self._last) * self._rate)
+		self._last   = now
+
+		if self._tokens >= 1:
+			self._tokens -= 1
+			return 0.0
+
+		return (1 - self._tokens) / self._rate
+
+	async def acquire(self):
+		if self._alock is None:
+			self._alock = asyncio.Lock()
+
+		async with self._alock:
+			while True:
+				wait = self._take()
+				if wait == 0.0:
+					return
+
+				await asyncio.sleep(wait)
+
+	def acquire_sync(self):
+		with self._tlock:
+			while True:
+				wait = self._take()
+				if wait == 0.0:
+					return
+
+				time.sleep(wait)
+
+def _http_get(url, backend='requests'):
+	# Returns the response body if the status is 200, otherwise None. The response is streamed, 
+	# so on errors the connection is closed after reading the headers, without downloading the body.
+	if backend == 'requests':
+		response = _get_session().get(url, stream=True, timeout=_TIMEOUT)
+		try:
+			return response.content if response.status_code == 200 else None
+		finally:
+			response.close()
+
+	elif backend == 'httpx':
+		# httpx has no status-based retries, so 429/5xx are retried here with the same backoff as the async lookups
+		for attempt in range(_MAX_ATTEMPTS):
+			with _get_httpx_client().stream('GET', url) as response:
+				if response.status_code == 200:
+					return response.read()
+				elif response.status_code not in _RETRY_STATUSES or attempt == _MAX_ATTEMPTS - 1:
+					return None
+
+				delay = _backoff(attempt, response.headers.get('Retry-After'))
+
+			time.sleep(delay)
+
+	else:
+		raise ValueError("Oops! Unknown backend '%s', expected 'requests' or 'httpx'." % backend)
+
+def _backoff(attempt, retry_after=None):
+	# `Retry-After` is either a number of seconds or an HTTP date, and is capped to `_MAX_BACKOFF`
+	if retry_after is not None:
+		try:
+			delay = float(retry_after)
+		except ValueError:
+			try:
+				delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+			except (TypeError, ValueError):
+				delay = None
+
+		if delay is not None:
+			return min(max(0.0, delay), _MAX_BACKOFF)
+
+	return min((2 ** attempt) * 0.5 + random.random() * 0.1, _MAX_BACKOFF)
+
+class _UrlBuilder:
+	"""
+	Builds 'Find Place' request URLs for one API key: the constant part of the query string is 
+	encoded once, so each request only needs to quote the address.
+	"""
+	__slots__ = ('prefix',)
+
+	def __init__(self, api_key, fields):
+		self.prefix = _PLACE_URL + '?' + urlencode({**_BASE_PARAMS, "fields": fields, "key": api_key}) + '&input='
+
+	def url(self, address):
+		return self.prefix + quote_plus(address)
+
+@functools.lru_cache(maxsize=32)
+def _url_builder(api_key, fields):
+	return _UrlBuilder(api_key, fields)
+
+def _join_fields(fields):
+	if isinstance(fields, str):
+		return fields
+
+	return _join_fields_tuple(tuple(fields))
+
+@functools.lru_cache(maxsize=32)
+def _join_fields_tuple(fields):
+	return ','.join(fields)
+
+def _cache_key(address, fields):
+	return _namespaced_key('find_place', (address.strip().lower(), fields))
+
 #EOF
\ No newline at end of file
@@ -1,10 +1,14 @@
 import inspect
+import asyncio
+import numbers
+import functools
+import pandas
 
 from gistools.utils     import is_numeric, merge_dicts
 from gistools.geometry  import Point
 from gistools.plus_code import encode
-from gistools.strings   import normalize, similarity, clean
-from gistools.gmaps     import set_credentials
+from gistools.strings   import normalize, similarity, similarity_batch, similarity_pairs, clean
+from gistools.gmaps     import set_credentials, geocode_many, cache_get, cache_set
 
 '''
 geocode("Grevin").describe()
@@ -16,7 +20,7 @@ find_place(input_text='Musee Grevin', location=(48.871162, 2.344007), radius=0).
 place_details('ChIJVUrgmz5u5kcRWPSN-T8a730').describe()
 '''
 
-__all__ = ['BUSINESS_TYPES', 'Place', 'geocode', 'autocomplete', 'text_search', 'find_place', 'radar', 'place_details']
+__all__ = ['BUSINESS_TYPES', 'Place', 'geocode', 'batch_geocode', 'geocode_dataframe', 'autocomplete', 'text_search', 'find_place', 'radar', 'place_details']
 
 THRESHOLD_ON_NAME = 0.0
 THRESHOLD_ON_CITY = 0.9
@@ -24,7 +28,7 @@ THRESHOLD_ON_POSTAL_CODE = 1
 THRESHOLD_ON_ADDR = 0.0
 THRESHOLD = 0.85
 
-BUSINESS_TYPES = [
+BUSINESS_TYPES = frozenset([
     'accounting',
     'airport',
     'amusement_park',
@@ -129,7 +133,132 @@ BUSINESS_TYPES = [
 	'place_of_worship',
 	'grocery_or_supermarket',
 	'colloquial_area'
-]
+])
+
+# candidate addresses recur across records of a batch, normalize each distinct string only once
+_normalize_cached = functools.lru_cache(maxsize=8192)(normalize)
+
+# batches often geocode to the same coordinates, the plus code of a (latitude, longitude) pair is computed only once
+_encode = functools.lru_cache(maxsize=4096)(encode)
+
+def _index_components(components):
+	# position of the first component of each main type (types[0]) and of each type, in a single pass
+	main_types, all_types = {}, {}
+
+	for k, c in enumerate(components):
+		types = c['types']
+		main_types.setdefault(types[0], k)
+
+		for t in types:
+			all_types.setdefault(t, k)
+
+	return main_types, all_types
+
+def _get_component(components, index, types, name='long_name'):
+	# first component matching any of the given types, as the former per-field loops did
+	positions = [index[t] for t in types if t in index]
+
+	return components[min(positions)][name] if len(positions) > 0 else ''
+
+# address fields read from the address components: 
+# field -> (accepted component types, match any of the component types rather than its main one, name to read)
+_FIELD_TYPES = {
+	'street_number'     : (('street_number',)                , False, 'long_name' ),
+	'street'            : (('route', 'colloquial_area')      , False, 'long_name' ),
+	'city'              : (('locality', 'postal_town')       , True , 'long_name' ),
+	'sub_locality'      : (('sublocality',)                  , True , 'long_name' ),
+	'postal_code'       : (('postal_code',)                  , False, 'long_name' ),
+	'admin_area_level_2': (('administrative_area_level_2',)  , False, 'long_name' ),
+	'admin_area_level_1': (('administrative_area_level_1',)  , False, 'long_name' ),
+	'country'           : (('country',)                      , False, 'long_name' ),
+	'country_code'      : (('country',)                      , False, 'short_name'),
+}
+
+# place details only take the street from a route
+_PLACE_FIELD_TYPES = {**_FIELD_TYPES, 'street': (('route',), False, 'long_name')}
+
+def _set_address_fields(record, components, field_types=_FIELD_TYPES):
+	main_types, all_types = _index_components(components)
+
+	for field, (types, any_type, name) in field_types.items():
+		record[field] = _get_component(components, all_types if any_type else main_types, types, name)
+
+	record['country_code'] = record['country_code'].lower()
+
+	return record
+
+# empty result record, every value is immutable so a shallow copy is enough
+_RESULT_TEMPLATE = {
+	'formatted_address': '',
+	'street_number': '',
+	'street': '',
+	'address': '',
+	'city': '',
+	'city_id': '',
+	'sub_locality': '',
+	'postal_code': '',
+	'admin_area_level_2': '',
+	'admin_area_level_1': '',
+	'country': '',
+	'country_code': '',
+	'latitude': 0.0,
+	'longitude': 0.0,
+	'location_type': 'NOT_FOUND',
+	'location_accuracy': 0,
+	'place_id': '',
+	'place_name': '',
+	'place_type': '',
+	'place_main_type': '',
+	'place_main_type_id': '',
+	'place_brand': '',
+	'plus_code': '',
+	'confidence': 0.0,
+	'confidence_on_name': 0.0,
+	'confidence_on_addr': 0.0,
+	'confidence_on_city': 0.0,
+	'confidence_on_postal_code': 0.0,
+	'confidence_on_country': 0.0,
+	'accepted' : False,
+	'api_used' : '',
+	'maps_URL' : '',
+	'place_URL': '',
+	'website'  : '',
+	'phone'    : '',
+	'email'    : '',
+	'monday'   : '',
+	'tuesday'  : '',
+	'wednesday': '',
+	'thursday' : '',
+	'friday'   : '',
+	'saturday' : '',
+	'sunday'   : '',
+}
+
+def _cached_call(namespace, key, call, **kwargs):
+	# responses are kept in the gmaps cache (in memory, and on disk if GISTOOLS_GMAPS_CACHE_DB is set)
+	data = cache_get(namespace, key)
+
+	if data is None:
+		data = call(**kwargs)
+		cache_set(namespace, key, data)
+
+	return data
+
+def _geocode_key(query, language, components):
+	return (query, language or '', sorted((components or {}).items()))
+
+def _place_details(stub, place_id, language=None):
+	if language is None:
+		return _cached_call('place', (place_id, ''), stub.place, place_id=place_id)
+
+	return _cached_call('place', (place_id, language), stub.place, place_id=place_id, language=language)
+
+def _postal_code_str(value):
+	# numeric codes (e.g. 75001.0, as pandas loads a postal code column with missing values) are written as integers
+	if isinstance(value, numbers.Real) and not isinstance(value, bool) and float(value).is_integer():
+		value = int(value)
+
+	return str(value).strip().upper().replace(' ', '')
 
 def refine_address(record):
 	s1 = record['formatted_address']
@@ -168,6 +297,8 @@ class Place(Point):
 	
 	@property
 	def data(self):
+		self.plus_code # encoded on first access, as in Point.data
+
 		return self._data
 	
 	@data.setter
@@ -208,13 +339,12 @@ class Place(Point):
 		best_k = -1
 		formatted_address = None
 
-		s1 = normalize(input_text)
+		s1 = _normalize_cached(input_text)
 
 		if len(geocoding) > 0:
-			for k, gc in enumerate(geocoding):
-				s2 = normalize(gc.get('formatted_address', ''))
+			choices = [_normalize_cached(gc.get('formatted_address', '')) for gc in geocoding]
 
-				cf = similarity(s1, s2, lcs=True)
+			for k, cf in enumerate(similarity_batch(s1, choices, lcs=True)):
 				if cf > best_ratio:
 					best_ratio = cf
 					best_k  = k
@@ -230,120 +360,6 @@ class Place(Point):
 
 		return lat, lng
 
-	@staticmethod
-	def __gc_get_street_number(geocoding, index=0):
-		street_number = ''
-		nb_components = len(geocoding[index]['address_components'])
-
-		for k in range(nb_components):
-			if (geocoding[index]['address_components'][k]['types'][0] == 'street_number'):
-				street_number = geocoding[index]['address_components'][k]['long_name']
-				break
-
-		return street_number
-
-	@staticmethod
-	def __gc_get_street(geocoding, index=0):
-		street = ''
-		nb_components = len(geocoding[index]['address_components'])
-		
-		for k in range(nb_components):
-			if (geocoding[index]['address_components'][k]['types'][0] == 'route'):
-				street = geocoding[index]['address_components'][k]['long_name']
-				break
-
-			if (geocoding[index]['address_components'][k]['types'][0] == 'colloquial_area'):
-				street = geocoding[index]['address_components'][k]['long_name']
-				break
-				
-		return street
-
-	@staticmethod
-	def __gc_get_city(geocoding, index=0):
-		city = ''
-		nb_components = len(geocoding[index]['address_components'])
-
-		for k in range(nb_components):
-			types = geocoding[index]['address_components'][k]['types']
-			if ('locality' in types) or ('postal_town' in types):
-				city = geocoding[index]['address_components'][k]['long_name']
-				break
-
-		return city
-
-	@staticmethod
-	def __gc_get_sub_locality(geocoding, index=0):
-		sub_locality = ''
-		nb_components = len(geocoding[index]['address_components'])
-
-		for k in range(nb_components):
-			types = geocoding[index]['address_components'][k]['types']
-			if ('sublocality' in types):
-				sub_locality = geocoding[index]['address_components'][k]['long_name']
-				break
-
-		return sub_locality
-
-	@staticmethod
-	def __gc_get_postal_code(geocoding, index=0):
-		postal_code = ''
-		nb_components = len(geocoding[index]['address_components'])
-
-		for k in range(nb_components):
-			if (geocoding[index]['address_components'][k]['types'][0] == 'postal_code'):
-				postal_code = geocoding[index]['address_components'][k]['long_name']
-				break
-
-		return postal_code
-
-	@staticmethod
-	def __gc_get_admin_area_level_2(geocoding, index=0):
-		admin_area_level_2 = ''
-		nb_components = len(geocoding[index]['address_components'])
-
-		for k in range(nb_components):
-			if (geocoding[index]['address_components'][k]['types'][0] == 'administrative_area_level_2'):
-				admin_area_level_2 = geocoding[index]['address_components'][k]['long_name']
-				break
-
-		return admin_area_level_2
-
-	@staticmethod
-	def __gc_get_admin_area_level_1(geocoding, index=0):
-		admin_area_level_1 = ''
-		nb_components = len(geocoding[index]['address_components'])
-
-		for k in range(nb_components):
-			if (geocoding[index]['address_components'][k]['types'][0] == 'administrative_area_level_1'):
-				admin_area_level_1 = geocoding[index]['address_components'][k]['long_name']
-				break
-
-		return admin_area_level_1
-
-	@staticmethod
-	def __gc_get_country(geocoding, index=0):
-		country = ''
-		nb_components = len(geocoding[index]['address_components'])
-
-		for k in range(nb_components):
-			if (geocoding[index]['address_components'][k]['types'][0] == 'country'):
-				country = geocoding[index]['address_components'][k]['long_name']
-				break
-
-		return country
-
-	@staticmethod
-	def __gc_get_country_code(geocoding, index=0):
-		country_code = ''
-		nb_components = len(geocoding[index]['address_components'])
-
-		for k in range(nb_components):
-			if (geocoding[index]['address_components'][k]['types'][0] == 'country'):
-				country_code = geocoding[index]['address_components'][k]['short_name']
-				break
-
-		return country_code.lower()
-
 	@staticmethod
 	def __gc_get_location_type(geocoding, index=0):
 		location_type = geocoding[index]['geometry']['location_type']
@@ -357,13 +373,6 @@ class Place(Point):
 	def __gc_get_place_id(geocoding, index=0):
 		return geocoding[index]['place_id']
 
-	@staticmethod
-	def __gc_get_plus_code(geocoding, index=0):
-		lat = geocoding[index]['geometry']['location']['lat']
-		lng = geocoding[index]['geometry']['location']['lng']
-
-		return encode(lat, lng)
-	
 	@staticmethod
 	def __pl_get_formatted_address(place_details=None, input_text=None, places=None):
 		best_ratio = 0.0
@@ -376,26 +385,29 @@ class Place(Point):
 
 			if input_text is not None:
 				best_ratio = similarity(
-					normalize(input_text), 
-					normalize(formatted_address), 
+					_normalize_cached(input_text), 
+					_normalize_cached(formatted_address), 
 					lcs=True
 				)
 
 		elif len(places) > 0:
-			for k, pl in enumerate(places):
-				s1 = normalize(input_text)
+			s1 = _normalize_cached(input_text)
+			choices = []
 
+			for pl in places:
 				try:
 					s2 = pl.get('formatted_address', '')
 					if len(s2) == 0:
 						s2 = pl.get('vicinity', '')
 
-					s2 = normalize(s2)
+					s2 = _normalize_cached(s2)
 
 				except:
 					s2 = ''
 
-				cf = similarity(s1, s2, lcs=True)
+				choices.append(s2)
+
+			for k, cf in enumerate(similarity_batch(s1, choices, lcs=True)):
 				if cf > best_ratio:
 					best_ratio = cf
 					best_k = k
@@ -411,117 +423,6 @@ class Place(Point):
 
 		return lat, lng
 
-	@staticmethod
-	def __pl_get_street_number(place_details):
-		street_number = ''
-
-		nb_components = len(place_details['result']['address_components'])
-
-		for k in range(nb_components):
-			if (place_details['result']['address_components'][k]['types'][0] == 'street_number'):
-				street_number = place_details['result']['address_components'][k]['long_name']
-				break
-
-		return street_number
-
-	@staticmethod
-	def __pl_get_street(place_details):
-		street = ''
-		nb_components = len(place_details['result']['address_components'])
-
-		for k in range(nb_components):
-			if (place_details['result']['address_components'][k]['types'][0] == 'route'):
-				street = place_details['result']['address_components'][k]['long_name']
-				break
-
-		return street
-
-	@staticmethod
-	def __pl_get_city(place_details):
-		city = ''
-		nb_components = len(place_details['result']['address_components'])
-
-		for k in range(nb_components):
-			types = place_details['result']['address_components'][k]['types']
-			if ('locality' in types) or ('postal_town' in types):
-				city = place_details['result']['address_components'][k]['long_name']
-				break
-
-		return city
-
-	@staticmethod
-	def __pl_get_sub_locality(place_details):
-		sub_locality = ''
-		nb_components = len(place_details['result']['address_components'])
-
-		for k in range(nb_components):
-			types = place_details['result']['address_components'][k]['types']
-			if 'sublocality' in types:
-				sub_locality = place_details['result']['address_components'][k]['long_name']
-				break
-
-		return sub_locality
-
-	@staticmethod
-	def __pl_get_postal_code(place_details):
-		postal_code = ''
-		nb_components = len(place_details['result']['address_components'])
-
-		for k in range(nb_components):
-			if (place_details['result']['address_components'][k]['types'][0] == 'postal_code'):
-				postal_code = place_details['result']['address_components'][k]['long_name']
-				break
-
-		return postal_code
-
-	@staticmethod
-	def __pl_get_admin_area_level_2(place_details):
-		admin_area_level_2 = ''
-		nb_components = len(place_details['result']['address_components'])
-
-		for k in range(nb_components):
-			if (place_details['result']['address_components'][k]['types'][0] == 'administrative_area_level_2'):
-				admin_area_level_2 = place_details['result']['address_components'][k]['long_name']
-				break
-
-		return admin_area_level_2
-
-	@staticmethod
-	def __pl_get_admin_area_level_1(place_details):
-		admin_area_level_1 = ''
-		nb_components = len(place_details['result']['address_components'])
-
-		for k in range(nb_components):
-			if (place_details['result']['address_components'][k]['types'][0] == 'administrative_area_level_1'):
-				admin_area_level_1 = place_details['result']['address_components'][k]['long_name']
-				break
-
-		return admin_area_level_1
-
-	@staticmethod
-	def __pl_get_country(place_details):
-		country = ''
-		nb_components = len(place_details['result']['address_components'])
-
-		for k in range(nb_components):
-			if (place_details['result']['address_components'][k]['types'][0] == 'country'):
-				country = place_details['result']['address_components'][k]['long_name']
-				break
-
-		return country
-
-	@staticmethod
-	def __pl_get_country_code(place_details):
-		country_code = ''
-		nb_components = len(place_details['result']['address_components'])
-
-		for k in range(nb_components):
-			if (place_details['result']['address_components'][k]['types'][0] == 'country'):
-				country_code = place_details['result']['address_components'][k]['short_name']
-				break
-
-		return country_code.lower()
-
 	@staticmethod
 	def __pl_get_location_type(place_details):
 		return 'ROOFTOP'
@@ -547,41 +448,34 @@ class Place(Point):
 		return place_details['result']['types'][0]
 
 	@staticmethod
-	def __pl_get_plus_code(place_details):
-		lat = place_details['result']['geometry']['location']['lat']
-		lng = place_details['result']['geometry']['location']['lng']
-
-		return encode(lat, lng)
-
-	@staticmethod
-	def __pl_get_place_url(place_details):
+	def __pl_get_place_url(place_details, isestablishment):
 		r = ''
 
-		if 'establishment' in place_details['result']['types']:
+		if isestablishment:
 			r = place_details['result'].get('url', '')
 
 		return r
 		
 	@staticmethod
-	def __pl_get_website(place_details):
+	def __pl_get_website(place_details, isestablishment):
 		r = ''
 
-		if 'establishment' in place_details['result']['types']:
+		if isestablishment:
 			r = place_details['result'].get('website', '')
 
 		return r
 	
 	@staticmethod
-	def __pl_get_phone_number(place_details):
+	def __pl_get_phone_number(place_details, isestablishment):
 		r = ''
 
-		if 'establishment' in place_details['result']['types']:
+		if isestablishment:
 			r = place_details['result'].get('international_phone_number', '')
 
 		return r
 		
 	@staticmethod
-	def __pl_get_opening_hours(place_details):
+	def __pl_get_opening_hours(place_details, isestablishment):
 		def to_timestr(s):
 			return '{}:{}'.format(s[:2],s[-2:])
 
@@ -589,7 +483,7 @@ class Place(Point):
 
 		r = {}
 
-		if 'establishment' in place_details['result']['types']:
+		if isestablishment:
 			try:
 				for p in place_details['result']['opening_hours']['periods']:
 					l = labels[int(p.get('open').get('day'))-1]
@@ -615,31 +509,26 @@ class Place(Point):
 		return round(c, 2)
 
 	@staticmethod
-	def __get_confidence_on_addr(record, result):
-		c = 0.0
+	def __get_confidence_on_addr_and_city(record, result):
+		# both are plain Levenshtein ratios, every available pair is scored in a single call
+		pairs = []
 
 		if record.get('input_address', None) is not None:
 			if result.get('address', None) is not None:
-				c = similarity(record.get('input_address'), result.get('address'), lcs=False)
-
-		return round(c, 2)
-
-	@staticmethod
-	def __get_confidence_on_city(record, result):
-		c = 0.0
+				pairs.append(('address', record.get('input_address'), result.get('address')))
 
 		if record.get('input_city', None) is not None:
-			c1 = 0.0
-			c2 = 0.0
+			for k in ('city', 'sub_locality'):
+				if result.get(k, None) is not None:
+					pairs.append((k, record.get('input_city'), result.get(k)))
 
-			if result.get('city', None) is not None:
-				c1 = similarity(record.get('input_city'), result.get('city'), lcs=False)
-			if result.get('sub_locality', None) is not None:
-				c2 = similarity(record.get('input_city'), result.get('sub_locality'), lcs=False)
+		c = {'address': 0.0, 'city': 0.0, 'sub_locality': 0.0}
 
-			c = max(c1, c2)
+		if len(pairs) > 0:
+			keys, lefts, rights = zip(*pairs)
+			c.update(zip(keys, similarity_pairs(list(lefts), list(rights), lcs=False)))
 
-		return round(c, 2)
+		return round(c['address'], 2), round(max(c['city'], c['sub_locality']), 2)
 
 	@staticmethod
 	def __get_confidence_on_postal_code(record, result):
@@ -647,13 +536,20 @@ class Place(Point):
 
 		input_postal_code = record.get('input_postal_code', None)
 
-		if input_postal_code is not None:
+		# a missing value of a dataframe column (NaN) means no postal code was given, as None does
+		if input_postal_code is not None and not pandas.isna(input_postal_code):
 			c = 0
 
 			postal_code = result.get('postal_code', None)
 			if postal_code is not None:
-				if int(input_postal_code) == int(postal_code):
-					c = 1
+				pc_in  = _postal_code_str(input_postal_code)
+				pc_out = _postal_code_str(postal_code)
+
+				# numeric codes are compared as integers so that a lost leading zero still matches
+				if pc_in.isdigit() and pc_out.isdigit():
+					c = int(int(pc_in) == int(pc_out))
+				else:
+					c = int(pc_in == pc_out)
 
 		return round(c, 2)
 
@@ -713,51 +609,7 @@ class Place(Point):
 
 	@staticmethod
 	def __init_result():
-		return {
-			'formatted_address': '',
-			'street_number': '',
-			'street': '',
-			'address': '',
-			'city': '',
-			'city_id': '',
-			'sub_locality': '',
-			'postal_code': '',
-			'admin_area_level_2': '',
-			'admin_area_level_1': '',
-			'country': '',
-			'country_code': '',
-			'latitude': 0.0,
-			'longitude': 0.0,
-			'location_type': 'NOT_FOUND',
-			'location_accuracy': 0,
-			'place_id': '',
-			'place_name': '',
-			'place_type': '',
-			'place_main_type': '',
-			'place_main_type_id': '',
-			'place_brand': '',
-			'plus_code': '',
-			'confidence': 0.0,
-			'confidence_on_name': 0.0,
-			'confidence_on_addr': 0.0,
-			'confidence_on_city': 0.0,
-			'confidence_on_postal_code': 0.0,
-			'confidence_on_country': 0.0,
-			'accepted' : False,
-			'api_used' : '',
-			'maps_URL' : '',
-			'place_URL': '',
-			'website'  : '',
-			'phone'    : '',
-			'email'    : '',
-			'monday'   : '',
-			'tuesday'  : '',
-			'wednesday': '',
-			'thursday' : '',
-			'friday'   : '',
-			'saturday' : '',
-			'sunday'   : '',
-		}
+		return _RESULT_TEMPLATE.copy()
 
 	@staticmethod
 	def __init_stub(stub):
@@ -768,8 +620,8 @@ class Place(Point):
 	
 	def __get_accuracy_and_confidence(self, record):
 		record['confidence_on_name']        = self.__get_confidence_on_name(self._data, record)
-		record['confidence_on_addr']        = self.__get_confidence_on_addr(self._data, record)
-		record['confidence_on_city']        = self.__get_confidence_on_city(self._data, record)
+		record['confidence_on_addr'], \
+		record['confidence_on_city']        = self.__get_confidence_on_addr_and_city(self._data, record)
 		record['confidence_on_postal_code'] = self.__get_confidence_on_postal_code(self._data, record)
 		record['confidence_on_country']     = self.__get_confidence_on_country(self._data, record)
 
@@ -786,35 +638,28 @@ class Place(Point):
 			record['formatted_address'] = response[k]['formatted_address']
 
 		if k != -1:
-			record['street_number']                 = self.__gc_get_street_number(response, k)
-			record['street']                        = self.__gc_get_street(response, k)
-			record['city']                          = self.__gc_get_city(response, k)
-			record['sub_locality']                  = self.__gc_get_sub_locality(response, k)
-			record['postal_code']                   = self.__gc_get_postal_code(response, k)
-			record['admin_area_level_2']            = self.__gc_get_admin_area_level_2(response, k)
-			record['admin_area_level_1']            = self.__gc_get_admin_area_level_1(response, k)
-			record['country']                       = self.__gc_get_country(response, k)
-			record['country_code']                  = self.__gc_get_country_code(response, k)
+			record = _set_address_fields(record, response[k]['address_components'])
+
 			record['latitude'], record['longitude'] = self.__gc_get_geometry(response, k)
 			record['location_type']                 = self.__gc_get_location_type(response, k)
 			record['place_id']                      = self.__gc_get_place_id(response, k)
-			record['plus_code']                     = self.__gc_get_plus_code(response, k)
+			record['plus_code']                     = _encode(record['latitude'], record['longitude'])
 
-			record['maps_URL' ] = 'https://www.google.com/maps/search/?api=1&query={:.6f}%2C{:.6f}&query_place_id={}'.format(
-				record['latitude'], record['longitude'], record['place_id']
-			)
+			record['maps_URL' ] = f"https://www.google.com/maps/search/?api=1&query={record['latitude']:.6f}%2C{record['longitude']:.6f}&query_place_id={record['place_id']}"
 
 		return record
 
 	def __gc_get_place_details(self, record, response):
+		isestablishment = 'establishment' in response['result']['types']
+
 		record['place_name']      = self.__pl_get_place_name(response)
 		record['place_type']      = self.__pl_get_place_type(response)
 		record['place_main_type'] = self.__pl_get_place_main_type(response)
-		record['place_URL']       = self.__pl_get_place_url(response)
-		record['website']         = self.__pl_get_website(response)
-		record['phone']           = self.__pl_get_phone_number(response)
+		record['place_URL']       = self.__pl_get_place_url(response, isestablishment)
+		record['website']         = self.__pl_get_website(response, isestablishment)
+		record['phone']           = self.__pl_get_phone_number(response, isestablishment)
 
-		opening_hours = self.__pl_get_opening_hours(response)
+		opening_hours = self.__pl_get_opening_hours(response, isestablishment)
 		if len(opening_hours) > 0:
 			record = merge_dicts(record, opening_hours)
 
@@ -826,31 +671,24 @@ class Place(Point):
 		else:
 			_, record['formatted_address'], _ = self.__pl_get_formatted_address(response)
 
-		record['street_number']                 = self.__pl_get_street_number(response)
-		record['street']                        = self.__pl_get_street(response)
-		record['city']                          = self.__pl_get_city(response)
-		record['sub_locality']                  = self.__pl_get_sub_locality(response)
-		record['postal_code']                   = self.__pl_get_postal_code(response)
-		record['admin_area_level_2']            = self.__pl_get_admin_area_level_2(response)
-		record['admin_area_level_1']            = self.__pl_get_admin_area_level_1(response)
-		record['country']                       = self.__pl_get_country(response)
-		record['country_code']                  = self.__pl_get_country_code(response)
+		isestablishment = 'establishment' in response['result']['types']
+
+		record = _set_address_fields(record, response['result']['address_components'], _PLACE_FIELD_TYPES)
+
 		record['latitude'], record['longitude'] = self.__pl_get_geometry(response)
 		record['location_type']                 = self.__pl_get_location_type(response)
 		record['place_id']                      = self.__pl_get_place_id(response)
 		record['place_name']                    = self.__pl_get_place_name(response)
 		record['place_type']                    = self.__pl_get_place_type(response)
 		record['place_main_type']               = self.__pl_get_place_main_type(response)
-		record['plus_code']                     = self.__pl_get_plus_code(response)
-		record['place_URL']                     = self.__pl_get_place_url(response)
-		record['website']                       = self.__pl_get_website(response)
-		record['phone']                         = self.__pl_get_phone_number(response)
+		record['plus_code']                     = _encode(record['latitude'], record['longitude'])
+		record['place_URL']                     = self.__pl_get_place_url(response, isestablishment)
+		record['website']                       = self.__pl_get_website(response, isestablishment)
+		record['phone']                         = self.__pl_get_phone_number(response, isestablishment)
 		
-		record['maps_URL' ] = 'https://www.google.com/maps/search/?api=1&query={:.6f}%2C{:.6f}&query_place_id={}'.format(
-			record['latitude'], record['longitude'], record['place_id']
-		)
+		record['maps_URL' ] = f"https://www.google.com/maps/search/?api=1&query={record['latitude']:.6f}%2C{record['longitude']:.6f}&query_place_id={record['place_id']}"
 
-		opening_hours = self.__pl_get_opening_hours(response)
+		opening_hours = self.__pl_get_opening_hours(response, isestablishment)
 		if len(opening_hours) > 0:
 			record = merge_dicts(record, opening_hours)
 
@@ -879,13 +717,16 @@ class Place(Point):
 			if response is not None:
 				self._resp['reverse_geocode'] = response['reverse_geocode']
 			else:
-				self._resp['reverse_geocode'] = stub.reverse_geocode(latlng=self.coordinates, language=self._language)
+				self._resp['reverse_geocode'] = _cached_call(
+					'reverse_geocode', ('%.6f,%.6f' % tuple(self.coordinates), self._language or ''), 
+					stub.reverse_geocode, latlng=self.coordinates, language=self._language
+				)
 
 			r = self.__gc_parse_response(None, r, self._resp['reverse_geocode'])
 			r = self.__get_address(r)
 
 			if self._isbusiness:
-				self._resp['place_details'] = stub.place(place_id=r['place_id'], language=self._language)
+				self._resp['place_details'] = _place_details(stub, r['place_id'], language=self._language)
 				r = self.__gc_get_place_details(r, self._resp['place_details'])
 
 			r['api_used'] = "reverse_geocode"
@@ -918,7 +759,7 @@ class Place(Point):
 						if response is not None:
 							self._resp['place_details'] = response['place_details']
 						else:
-							self._resp['place_details'] = stub.place(place_id=self._resp['geocode']['candidates'][0]['place_id'])
+							self._resp['place_details'] = _place_details(stub, self._resp['geocode']['candidates'][0]['place_id'])
 
 						r = self.__pl_details_parse_response(input_text=None, record=r, response=self._resp['place_details'])
 						r = self.__get_address(r)
@@ -929,13 +770,16 @@ class Place(Point):
 				if response is not None:
 					self._resp['geocode'] = response['geocode']
 				else:
-					self._resp['geocode'] = stub.geocode(address=query, components=self._components, language=self._language)
+					self._resp['geocode'] = _cached_call(
+						'geocode', _geocode_key(query, self._language, self._components), 
+						stub.geocode, address=query, components=self._components, language=self._language
+					)
 
 				r = self.__gc_parse_response(query, r, self._resp['geocode'])
 				r = self.__get_address(r)
 
 				if self._isbusiness:
-					self._resp['place_details'] = stub.place(place_id=r['place_id'], language=self._language)
+					self._resp['place_details'] = _place_details(stub, r['place_id'], language=self._language)
 					r = self.__gc_get_place_details(r, self._resp['place_details'])
 
 				r = self.__get_accuracy_and_confidence(r)
@@ -969,7 +813,7 @@ class Place(Point):
 					if response is not None:
 						self._resp['place_details'] = response['place_details']
 					else:
-						self._resp['place_details'] = stub.place(place_id=self._resp['autocomplete'][0]['place_id'])
+						self._resp['place_details'] = _place_details(stub, self._resp['autocomplete'][0]['place_id'])
 
 					r = self.__pl_details_parse_response(input_text=None, record=r, response=self._resp['place_details'])
 					r = self.__get_address(r)
@@ -1004,7 +848,7 @@ class Place(Point):
 					if response is not None:
 						self._resp['place_details'] = response['place_details']
 					else:
-						self._resp['place_details'] = stub.place(place_id=self._resp['text_search']['results'][0]['place_id'])
+						self._resp['place_details'] = _place_details(stub, self._resp['text_search']['results'][0]['place_id'])
 
 					r = self.__pl_details_parse_response(input_text=query, record=r, response=self._resp['place_details'])
 					r = self.__get_address(r)
@@ -1051,7 +895,7 @@ class Place(Point):
 				if response is not None:
 					self._resp['place_details'] = response['place_details']
 				else:
-					self._resp['place_details'] = stub.place(place_id=self._resp['find_place']['candidates'][0]['place_id'])
+					self._resp['place_details'] = _place_details(stub, self._resp['find_place']['candidates'][0]['place_id'])
 
 				r = self.__pl_details_parse_response(input_text=query, record=r, response=self._resp['place_details'])
 				r = self.__get_address(r)
@@ -1114,7 +958,7 @@ class Place(Point):
 			if response is not None:
 				self._resp['place_details'] = response['place_details']
 			else:
-				self._resp['place_details'] = stub.place(place_id=self._data.get('input_text'))
+				self._resp['place_details'] = _place_details(stub, self._data.get('input_text'))
 
 			r = self.__pl_details_parse_response(input_text=None, record=r, response=self._resp['place_details'])
 			r = self.__get_address(r)
@@ -1357,10 +1201,6 @@ class Place(Point):
 	def place_brand(self):
 		return self._data.get('place_brand', None)
 
-	@property
-	def plus_code(self):
-		return self._data.get('plus_code', None)
-	
 	@property
 	def address(self):
 		return self._data.get('address', None)
@@ -1481,6 +1321,89 @@ def geocode(input_text, fields=None, components={'country': 'france'}, language=
 
 	return p.geocode(stub=stub, fields=fields)
 
+async def batch_geocode(places, fields=None, concurrency=10, queries_per_second=10, stub=None) -> list:
+	"""
+	Geocodes many places concurrently: the Geocoding API requests of text queries are sent asynchronously 
+	(see `gistools.gmaps.geocode_many`), then each response is parsed by `Place.geocode`. 
+	Phone numbers, the place details of businesses and the failed requests (e.g. 'OVER_QUERY_LIMIT') 
+	still go through the googlemaps client, in worker threads.
+
+	Returns:
+	- **list**: The geocoded places, in the same order.
+	"""
+	stub = set_credentials() if stub is None else stub
+	loop = asyncio.get_running_loop()
+
+	# text queries sharing a language and component filters are geocoded in one batch
+	batches = {}
+
+	for k, p in enumerate(places):
+		query = p.check_query(fields).input_text
+
+		if query is not None and not is_numeric(query):
+			batches.setdefault((p.language, tuple(sorted((p.components or {}).items()))), []).append(k)
+
+	responses = {}
+
+	for (language, components), index in batches.items():
+		keys = {k: _geocode_key(places[k].input_text, language, dict(components)) for k in index}
+
+		for k in index:
+			data = cache_get('geocode', keys[k])
+			if data is not None:
+				responses[k] = data
+
+		index   = [k for k in index if k not in responses]
+		results = await geocode_many(
+			[places[k].input_text for k in index], stub.key, 
+			components=dict(components), language=language, 
+			concurrency=concurrency, queries_per_second=queries_per_second
+		)
+
+		# failed requests (error status such as 'OVER_QUERY_LIMIT', or an exception) are left out of `responses`, 
+		# they go through the googlemaps client below, which retries them
+		for k, data in zip(index, results):
+			if isinstance(data, list):
+				cache_set('geocode', keys[k], data)
+				responses[k] = data
+
+	def parse(k, p):
+		if k in responses:
+			return p.geocode(stub=stub, response={'geocode': responses[k]})
+
+		return p.geocode(stub=stub)
+
+	return list(await asyncio.gather(*[loop.run_in_executor(None, parse, k, p) for k, p in enumerate(places)]))
+
+def geocode_dataframe(df, address_col='address', components={'country': 'france'}, language='fr', isbusiness=False, concurrency=10, queries_per_second=10, stub=None, **kwargs) -> pandas.DataFrame:
+	"""
+	Geocodes the addresses of a dataframe column with `batch_geocode`: each distinct address is geocoded once, 
+	and the records are mapped back onto the rows. Rows without an address are left empty.  
+	Runs its own event loop, so from a running loop (e.g. a notebook) await `batch_geocode` instead.
+
+	Args:
+	- **df (DataFrame)**: The dataframe to geocode.
+	- **address_col (str)**: The column holding the addresses.
+	- **concurrency (int)**: The maximum number of requests in flight.
+	- **queries_per_second (int)**: The maximum request rate.
+
+	Returns:
+	- **DataFrame**: The geocoding records, indexed like `df`.
+	"""
+	queries = df[address_col].astype('string').str.strip().replace('', pandas.NA)
+	unique  = queries.dropna().unique().tolist()
+
+	places = [Place(address=q, components=components, language=language, isbusiness=isbusiness, code_length=10) for q in unique]
+
+	if kwargs:
+		for p in places:
+			p.set_thresholds(**kwargs)
+
+	places  = asyncio.run(batch_geocode(places, concurrency=concurrency, queries_per_second=queries_per_second, stub=stub))
+	records = pandas.DataFrame.from_records([p.data for p in places], index=unique)
+
+	return records.reindex(queries.tolist()).set_axis(df.index, axis=0)
+
 def reverse_geocode(input_text, language='fr', stub=None, **kwargs) -> Place:
 	p = Place(
 		address=input_text, 
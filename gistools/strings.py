@@ -22,6 +22,8 @@ This module provides a collection of functions for string manipulation, text cle
 * `match`: Checks if two strings match using a specified metric.
 * `distance`: Calculates the distance between two strings using a specified metric.
 * `similarity`: Calculates the similarity between two strings using Levenshtein distance.
+* `similarity_batch`: Calculates the similarity between a string and each string of a list.
+* `similarity_pairs`: Calculates the similarity between the strings of two lists, pair by pair.
 
 **Other Functions:**
 * `str2list`: Converts a string to a list of strings.
@@ -30,6 +32,7 @@ This module provides a collection of functions for string manipulation, text cle
 """
 import re
 import inspect
+import functools
 import unicodedata 
 import jellyfish
 
@@ -37,6 +40,12 @@ from unidecode   import unidecode
 from collections import OrderedDict
 from difflib     import SequenceMatcher
 
+try:
+	from rapidfuzz          import process as rf_process
+	from rapidfuzz.distance import Indel
+except ImportError: # rapidfuzz is optional, batch similarities fall back to one similarity() call per pair
+	rf_process = None
+
 def is_string(val) -> bool:
 	"""
 	Checks if the input value is a string.
@@ -158,36 +167,49 @@ def clean(string: str) -> str:
 	return cleaned
 
 def longest_common_substring(s1: str, s2: str) -> str:
-	m = [[0] * (1 + len(s2)) for i in range(1 + len(s1))]
+	prev = [0] * (1 + len(s2))
 	longest, x_longest = 0, 0
-	for x in range(1, 1 + len(s1)):
-		for y in range(1, 1 + len(s2)):
-			if s1[x - 1] == s2[y - 1]:
-				m[x][y] = m[x - 1][y - 1] + 1
-				if m[x][y] > longest:
-					longest = m[x][y]
-					x_longest = x
-			else:
-				m[x][y] = 0
+	for x, c1 in enumerate(s1, 1):
+		row = [0]
+		for y, c2 in enumerate(s2):
+			n = prev[y] + 1 if c1 == c2 else 0
+			if n > longest:
+				longest = n
+				x_longest = x
+			row.append(n)
+		prev = row
 	result = s1[x_longest - longest: x_longest]
 
 	return remove_redundant_whitespaces(result)
 
-def longest_common_subsequence(a: str, b: str) -> str:
-	lengths = [[0 for j in range(len(b)+1)] for i in range(len(a)+1)]
-	# row 0 and column 0 are initialized to 0 already
+def _lcs_mask(a, b) -> int:
+	# Bit-parallel LCS (Allison-Dix / Hyyro): one bit per element of `a`, one big-int step per element of `b`.
+	# Bit i of the result is set when the LCS of a[:i+1] and b is longer than the LCS of a[:i] and b, 
+	# i.e. it marks the elements read out of the last column of the classic DP matrix.
+	masks, full = _lcs_bitmasks(a)
+	v = full
+
+	for y in b:
+		u = v & masks.get(y, 0)
+		v = ((v + u) | (v - u)) & full
+
+	return ~v & full
+
+@functools.lru_cache(maxsize=4096)
+def _lcs_bitmasks(a):
+	# match masks of `a`, cached since the same string is compared with many others (e.g. `similarity_batch`)
+	masks = {}
 	for i, x in enumerate(a):
-		for j, y in enumerate(b):
-			if x == y:
-				lengths[i+1][j+1] = lengths[i][j] + 1
-			else:
-				lengths[i+1][j+1] = max(lengths[i+1][j], lengths[i][j+1])
-	# read the substring out from the matrix
-	result = ""
-	j = len(b)
-	for i in range(1, len(a)+1):
-		if lengths[i][j] != lengths[i-1][j]:
-			result += a[i-1]
+		masks[x] = masks.get(x, 0) | (1 << i)
+
+	return masks, (1 << len(a)) - 1
+
+def _lcs_length(a, b) -> int:
+	return bin(_lcs_mask(a, b)).count('1')
+
+def longest_common_subsequence(a: str, b: str) -> str:
+	mask = _lcs_mask(a, b)
+	result = ''.join([x for i, x in enumerate(a) if (mask >> i) & 1])
 
 	return remove_redundant_whitespaces(result)
 
@@ -195,12 +217,9 @@ def most_frequent(lst: list) -> str:
 	return max(set(lst), key=lst.count)
 
 def longest_match(lst: list) -> str:
-	s2 = lst[0]
 	m = []
 
-	for i in range(1, len(lst)):
-		s1 = s2
-		s2 = lst[i]
+	for s1, s2 in zip(lst, lst[1:]):
 		match = SequenceMatcher(None, s1, s2).find_longest_match(0, len(s1), 0, len(s2))
 
 		m.append(remove_redundant_whitespaces(s1[match.a: match.a + match.size]))
@@ -225,20 +244,8 @@ def levenshtein_distance(token1: str, token2: str, normalize=True) -> dict:
 		m = len(s1)
 		n = len(s2)
 		lensum = float(m + n)
-		d = []           
-		for i in range(m+1):
-			d.append([i])        
-		del d[0][0]    
-		for j in range(n+1):
-			d[0].append(j)       
-		for j in range(1,n+1):
-			for i in range(1,m+1):
-				if s1[i-1] == s2[j-1]:
-					d[i].insert(j,d[i-1][j-1])           
-				else:
-					minimum = min(d[i-1][j]+1, d[i][j-1]+1, d[i-1][j-1]+2)         
-					d[i].insert(j, minimum)
-		ldist = d[-1][-1]
+		# with a substitution cost of 2 the distance only counts insertions and deletions: m + n - 2*LCS
+		ldist = m + n - 2*_lcs_length(s1, s2)
 		ratio = (lensum - ldist)/lensum
 	
 	return {'distance':ldist, 'ratio':ratio}
@@ -309,15 +316,15 @@ def distance(s1: str, s2: str, metric='jellyfish.jaro-winkler', lcs=False) -> di
 	return {'label': s1, 'ratio': r}
 
 def similarity(str_left: str, str_right: str, lcs=False) -> float:
-	s1 = str_left.lower()
-	s1 = replace_character(s1)
-	s1 = remove_keywords(s1)
-	s1 = s1.strip()
+	return _similarity_cleaned(_similarity_clean(str_left), _similarity_clean(str_right), lcs)
+
+def _similarity_clean(s: str) -> str:
+	return remove_keywords(replace_character(s.lower())).strip()
 
-	s2 = str_right.lower()
-	s2 = replace_character(s2)
-	s2 = remove_keywords(s2)
-	s2 = s2.strip()
+def _similarity_cleaned(s1: str, s2: str, lcs=False) -> float:
+	# identical strings score 1 in both modes, skip the LCS kernel (common once both sides are normalized)
+	if s1 == s2 and len(s1) > 0:
+		return 1.0
 
 	if not lcs:
 		cf = levenshtein_distance(s1, s2)
@@ -332,6 +339,64 @@ def similarity(str_left: str, str_right: str, lcs=False) -> float:
 
 	return cf['ratio']
 
+def _similarity_prepare(s: str) -> str:
+	# same cleaning as similarity(), plus the ASCII folding done by levenshtein_distance()
+	return unicodedata.normalize('NFKD', _similarity_clean(s)).encode('ascii', 'ignore').decode('ascii')
+
+def similarity_batch(str_left: str, choices: list, lcs=False) -> list:
+	"""
+	Calculates the similarity between a string and each string of a list.  
+	Returns the same ratios as calling `similarity(str_left, choice, lcs)` for each choice, 
+	but without `lcs` all the ratios are computed by a single rapidfuzz call when it is installed. 
+	With `lcs`, `str_left` is cleaned once and its LCS match masks are reused across the choices.
+
+	Args:
+	- **str_left**: The string to compare.
+	- **choices**: The list of strings to compare it with.
+	- **lcs**: Whether to compare on the longest common subsequence, as in `similarity`.
+
+	Returns:
+	- **list**: The similarity ratio of each choice, between 0 and 1.
+	"""
+	if lcs or rf_process is None or len(choices) == 0:
+		s1 = _similarity_clean(str_left)
+		return [_similarity_cleaned(s1, _similarity_clean(choice), lcs) for choice in choices]
+
+	s1 = _similarity_prepare(str_left)
+	s2 = [_similarity_prepare(choice) for choice in choices]
+
+	if len(s1) == 0:
+		return [0.0] * len(choices)
+
+	# the Indel distance is the Levenshtein distance with a substitution cost of 2 used by levenshtein_distance()
+	ratios = rf_process.cdist([s1], s2, scorer=Indel.normalized_similarity, dtype='float64')[0]
+
+	return [float(r) if len(s) > 0 else 0.0 for r, s in zip(ratios, s2)]
+
+def similarity_pairs(lefts: list, rights: list, lcs=False) -> list:
+	"""
+	Calculates the similarity between the strings of two lists, pair by pair.  
+	Returns the same ratios as calling `similarity(left, right, lcs)` for each pair, 
+	but without `lcs` all the ratios are computed by a single rapidfuzz call when it is installed.
+
+	Args:
+	- **lefts**: The first strings of the pairs.
+	- **rights**: The second strings of the pairs, same length as `lefts`.
+	- **lcs**: Whether to compare on the longest common subsequence, as in `similarity`.
+
+	Returns:
+	- **list**: The similarity ratio of each pair, between 0 and 1.
+	"""
+	if lcs or rf_process is None or not hasattr(rf_process, 'cpdist') or len(lefts) == 0:
+		return [similarity(left, right, lcs=lcs) for left, right in zip(lefts, rights)]
+
+	s1 = [_similarity_prepare(left) for left in lefts]
+	s2 = [_similarity_prepare(right) for right in rights]
+
+	ratios = rf_process.cpdist(s1, s2, scorer=Indel.normalized_similarity, dtype='float64')
+
+	return [float(r) if len(a) > 0 and len(b) > 0 else 0.0 for r, a, b in zip(ratios, s1, s2)]
+
 def str2list(s: str, sep=' ') -> list:
 	if is_string(s):
 		return s.replace('[', '').replace(']', '').replace(',', '').replace("'", '').split(sep)
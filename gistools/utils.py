@@ -16,6 +16,8 @@ The module aims to be user-friendly and concise, offering convenient solutions f
 * `has_method`: Checks if an object has a specific method. 
 * `get_class_name`: Retrieves the class name of the given object.
 * `get_class_attr`: Retrieves public attributes of a given class.
+* `njit`: Compiles a function with Numba when it is installed, otherwise returns it unchanged.
+* `prange`: `numba.prange` when Numba is installed, otherwise the builtin `range`.
 
 **Date/Time**
 * `isoformat_as_datetime`: Converts an ISO 8601 formatted string to a datetime object.
@@ -108,24 +110,27 @@ import time
 import inspect
 import operator
 import re
-import math
 import numpy
 import pandas
-import geopandas
 import types
 import os
 import codecs
 import json
-import pandas
 import csv
 import pickle
 import collections
-import pytz
 
 from operator import eq, ne, lt, le, gt, ge
 from datetime import datetime, timezone
 from pandas.core.frame import DataFrame
 
+try:
+	import numba
+	from numba import prange
+except ImportError: # Numba is optional, compiled kernels fall back to plain Python
+	numba  = None
+	prange = range
+
 def has_method(arg, method):
 	"""Checks if an object has a callable method with the given name.
 
@@ -176,6 +181,30 @@ def get_class_attr(classname):
 	attributes = inspect.getmembers(classname, lambda x : not(inspect.isroutine(x)))
 	return [x for x in attributes if not(x[0].startswith('__') and x[0].endswith('__'))]
 
+def njit(**options):
+	"""Compiles a function with `numba.njit` when Numba is installed.
+
+	This decorator factory lets numeric kernels be written once and run either
+	as machine code (Numba available) or as plain Python (Numba missing), so
+	Numba stays an optional dependency.
+
+	Args:
+	- **options**: Keyword arguments forwarded to `numba.njit` (e.g. `cache=True`, `parallel=True`).
+
+	Returns:
+	- **function**: A decorator returning the compiled function, or the original function if Numba is not installed.
+
+	Example:
+	- @njit(cache=True)  
+	  def kernel(x): return x * x
+	"""
+	def decorator(func):
+		if numba is None:
+			return func
+		return numba.njit(**options)(func)
+
+	return decorator
+
 #------------------------------------------------------------------------------
 # Date/Time
 #------------------------------------------------------------------------------
@@ -957,10 +986,11 @@ def find_duplicates(l: list) -> list:
 
 def add_to(l, value):
 	"""
-	Adds a value to each element in a list.
+	Adds a value to each element in a list.  
+	NumPy arrays and pandas Index/Series are added in a single vectorized operation.
 
 	Args:
-		l: The list to modify.
+		l: The list, array or pandas Index/Series to modify.
 		value: The value to add to each element.
 
 	Returns:
@@ -969,7 +999,10 @@ def add_to(l, value):
 	Example:
 		add_to([1, 2, 3], 5) # Output: [6, 7, 8]
 	"""
-	return list(map(lambda x: x+value, l))
+	if isinstance(l, (numpy.ndarray, pandas.Index, pandas.Series)):
+		return (numpy.asarray(l) + value).tolist()
+
+	return [x + value for x in l]
 
 #------------------------------------------------------------------------------
 # Dictionnaries
@@ -1140,7 +1173,7 @@ def is_dataframe(records):
 	Returns:
 		True if the object is a Pandas DataFrame or a GeoDataFrame, False otherwise.
 	"""
-	return isinstance(records, pandas.DataFrame) or isinstance(records, geopandas.GeoDataFrame)
+	return isinstance(records, pandas.DataFrame) # geopandas.GeoDataFrame is a subclass of pandas.DataFrame
 
 def get_columns(df, empty=False):
 	"""
@@ -1317,7 +1350,7 @@ def join(left, right, left_on, right_on, how='left', output=None):
 	else:
 		return df
 
-def to_geo(data: DataFrame, from_=('longitude', 'latitude'), epsg=4326) -> geopandas.GeoDataFrame:
+def to_geo(data: DataFrame, from_=('longitude', 'latitude'), epsg=4326) -> 'geopandas.GeoDataFrame':
 	"""
 	Converts a Pandas DataFrame to a GeoDataFrame with points based on longitude and latitude columns.
 
@@ -1329,9 +1362,13 @@ def to_geo(data: DataFrame, from_=('longitude', 'latitude'), epsg=4326) -> geopa
 	Returns:
 		A GeoDataFrame with a 'geometry' column containing points based on the specified columns.
 	"""
+	import geopandas # Imported on first use, geopandas is slow to load
+
 	return geopandas.GeoDataFrame(
-		data, geometry=geopandas.points_from_xy(x=data.get(from_[0]), y=data.get(from_[1]))
-	).set_crs(epsg=epsg)
+		data, 
+		geometry=geopandas.points_from_xy(x=data[from_[0]].to_numpy(), y=data[from_[1]].to_numpy()), 
+		crs=f'EPSG:{epsg}'
+	)
 
 def select(data, enum, on=None):
 	"""
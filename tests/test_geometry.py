@@ -0,0 +1,322 @@
+import json
+import random
+
+import numpy
+import polyline
+import pytest
+import shapely.geometry
+
+from gistools import geometry
+from gistools.geometry import (
+    Point,
+    PointArray,
+    PointView,
+    build_nearest_index,
+    decode_polyline,
+    decode_polyline_list,
+    find_nearest_point,
+    latlon,
+    nearest_point_batch,
+)
+from gistools.utils import is_float, is_list
+
+
+@pytest.fixture
+def encoded():
+    rng = random.Random(7)
+    lines = []
+    for _ in range(200):
+        coords = [(rng.uniform(-90, 90), rng.uniform(-180, 180)) for _ in range(rng.randint(1, 30))]
+        lines.append(polyline.encode(coords))
+    return lines
+
+
+@pytest.fixture(params=["numba", "python"])
+def backend(request, monkeypatch):
+    if request.param == "numba":
+        if geometry.numba is None:
+            pytest.skip("numba is not installed")
+    else:
+        monkeypatch.setattr(geometry, "numba", None)
+    return request.param
+
+
+def test_decode_polyline_matches_polyline(encoded, backend):
+    for line in encoded:
+        expected = numpy.asarray([[lon, lat] for lat, lon in polyline.decode(line)], dtype=numpy.float64)
+        numpy.testing.assert_array_equal(decode_polyline(line), expected)
+
+
+def test_decode_polyline_list_matches_polyline(encoded):
+    for line in encoded:
+        assert decode_polyline_list(line) == [[lon, lat] for lat, lon in polyline.decode(line)]
+
+
+def test_decode_polyline_empty(backend):
+    assert decode_polyline("").shape == (0, 2)
+
+
+def test_decode_polyline_truncated_raises_like_polyline(encoded, backend):
+    line = encoded[0][:-1]
+    with pytest.raises(Exception) as expected:
+        polyline.decode(line)
+    with pytest.raises(expected.type):
+        decode_polyline(line)
+
+
+def brute_force_haversine(src_lat, src_lon, dst_lat, dst_lon):
+    lat1, lon1 = numpy.radians(src_lat)[:, None], numpy.radians(src_lon)[:, None]
+    lat2, lon2 = numpy.radians(dst_lat)[None, :], numpy.radians(dst_lon)[None, :]
+    a = numpy.sin((lat2 - lat1) / 2) ** 2 + numpy.cos(lat1) * numpy.cos(lat2) * numpy.sin((lon2 - lon1) / 2) ** 2
+    return 2 * numpy.arcsin(numpy.sqrt(a))
+
+
+def geographic_points(rng, n, lon_range):
+    gpd = pytest.importorskip("geopandas")
+    lat = rng.uniform(-60, 60, n)
+    lon = rng.uniform(*lon_range, n)
+    lon = (lon + 180) % 360 - 180  # ranges crossing the antimeridian wrap to [-180, 180)
+    return gpd.GeoDataFrame({"v": numpy.arange(n)}, geometry=gpd.points_from_xy(lon, lat), crs="EPSG:4326")
+
+
+@pytest.mark.parametrize("lon_range", [(-180, 180), (170, 190)], ids=["world", "antimeridian"])
+def test_nearest_point_matches_brute_force_haversine(lon_range):
+    rng = numpy.random.default_rng(11)
+    source = geographic_points(rng, 150, lon_range)
+    destination = geographic_points(rng, 400, lon_range)
+
+    dist = brute_force_haversine(
+        source.geometry.y.to_numpy(), source.geometry.x.to_numpy(),
+        destination.geometry.y.to_numpy(), destination.geometry.x.to_numpy(),
+    )
+    best = dist.min(axis=1)
+    rows = numpy.arange(len(source))
+
+    index = build_nearest_index(destination)
+    for found in (nearest_point_batch(source, destination, "v"), nearest_point_batch(source, destination, "v", index=index)):
+        numpy.testing.assert_allclose(dist[rows, found.astype(int)], best, rtol=0, atol=1e-12)
+
+    for k in range(0, len(source), 15):
+        for kwargs in ({}, {"index": index}):
+            found = find_nearest_point(source.iloc[k], destination, "v", **kwargs)
+            assert dist[k, found] == pytest.approx(best[k], abs=1e-12)
+
+
+def test_nearest_point_is_planar_for_projected_or_non_point_geometries():
+    gpd = pytest.importorskip("geopandas")
+    shapely = pytest.importorskip("shapely")
+    rng = numpy.random.default_rng(5)
+
+    geometries = [
+        shapely.Point(x, y).buffer(r) if k % 3 == 0 else shapely.Point(x, y)
+        for k, (x, y, r) in enumerate(zip(rng.uniform(0, 1e5, 300), rng.uniform(0, 1e5, 300), rng.uniform(1, 500, 300)))
+    ]
+    destination = gpd.GeoDataFrame({"v": numpy.arange(300)}, geometry=geometries, crs="EPSG:2154")
+    source = gpd.GeoDataFrame(geometry=gpd.points_from_xy(rng.uniform(0, 1e5, 100), rng.uniform(0, 1e5, 100)), crs="EPSG:2154")
+
+    dist = numpy.array([[s.distance(d) for d in destination.geometry] for s in source.geometry])
+    best = dist.min(axis=1)
+    rows = numpy.arange(len(source))
+
+    found = nearest_point_batch(source, destination, "v")
+    numpy.testing.assert_allclose(dist[rows, found.astype(int)], best)
+
+    points_only = destination[[g.geom_type == "Point" for g in destination.geometry]]
+    for k in range(0, len(source), 10):
+        assert dist[k, find_nearest_point(source.iloc[k], destination, "v")] == pytest.approx(best[k])
+        assert find_nearest_point(source.iloc[k], points_only, "v") == points_only["v"].to_numpy()[
+            numpy.argmin([source.geometry.iloc[k].distance(g) for g in points_only.geometry])
+        ]
+
+
+@pytest.fixture
+def points():
+    return [
+        Point({"latitude": 48.871162, "longitude": 2.344007, "id": 1, "name": "Musee Grevin"}),
+        Point({"latitude": 48.8556, "longitude": 2.3601, "id": 2, "name": "Rue de Rivoli"}),
+        Point({"latitude": 43.2965, "longitude": 5.3698, "id": 3, "name": None}),
+    ]
+
+
+def test_point_array_round_trips_points(points):
+    array = PointArray.from_points(points)
+
+    assert len(array) == 3
+    assert [view.to_point().data for view in array] == [p.data for p in points]
+    assert array[-1].coordinates == points[-1].coordinates
+
+
+def test_point_array_iterates_views(points):
+    array = PointArray.from_points(points)
+    views = list(array)
+
+    assert all(isinstance(view, PointView) for view in views)
+    assert [view["name"] for view in views] == ["Musee Grevin", "Rue de Rivoli", None]
+    with pytest.raises(IndexError):
+        array[3]
+
+
+def test_point_view_writes_through(points):
+    array = PointArray.from_points(points)
+    view = array[1]
+
+    view["name"] = "Hotel de Ville, Paris"
+    view.latitude = 48.8566
+    view["longitude"] = 2.3522
+
+    assert array.columns["name"][1] == "Hotel de Ville, Paris"
+    assert array.latitude[1] == 48.8566 and array.longitude[1] == 2.3522
+    assert view["plus_code"] is None
+    assert view.to_point().plus_code == Point((48.8566, 2.3522)).plus_code
+    assert array[0]["plus_code"] == points[0].plus_code
+
+
+def test_point_array_slices_share_memory(points):
+    array = PointArray.from_points(points)
+    part = array[1:]
+
+    assert isinstance(part, PointArray) and len(part) == 2
+    assert numpy.shares_memory(part.latitude, array.latitude)
+    assert part[0].to_dict() == array[1].to_dict()
+
+    part[0]["name"] = "Chatelet"
+    assert array[1]["name"] == "Chatelet"
+
+    assert len(array[::2]) == 2
+    assert len(array[5:]) == 0
+
+
+def test_plus_code_is_encoded_lazily():
+    point = Point((48.871162, 2.344007))
+
+    assert point._data["plus_code"] is None
+    assert point.plus_code == "8FW4V8CV+FJ"
+    assert point.data["plus_code"] == "8FW4V8CV+FJ"
+
+
+@pytest.mark.parametrize("attribute, value", [("latitude", 48.8556), ("longitude", 2.3601)])
+def test_moving_a_point_invalidates_its_plus_code(attribute, value):
+    point = Point((48.871162, 2.344007))
+    before = point.plus_code
+
+    setattr(point, attribute, value)
+
+    assert point._data["plus_code"] is None
+    assert point.plus_code != before
+    assert point.plus_code == Point(point.coordinates).plus_code
+
+
+def test_changing_the_code_length_invalidates_the_plus_code():
+    point = Point((48.871162, 2.344007))
+    point.plus_code
+    point.code_length = 8
+
+    assert point.plus_code == "8FW4V8CV+"
+
+
+@pytest.mark.parametrize("code", ["", "9C3XGV00+", "stale"])
+def test_plus_code_given_with_coordinates_is_encoded_again(code):
+    point = Point({"latitude": 48.871162, "longitude": 2.344007, "plus_code": code})
+
+    assert point.plus_code == "8FW4V8CV+FJ"
+
+
+def reference_latlon(arg):
+    # The generic path, as before the tuple/list fast path
+    if isinstance(arg, shapely.geometry.Point):
+        return arg.y, arg.x
+    if isinstance(arg, dict):
+        if "geometry" in arg:
+            return arg["geometry"].y, arg["geometry"].x
+        for la, ln in geometry._LATLON_KEYS:
+            if la in arg and ln in arg:
+                return arg[la], arg[ln]
+    elif is_list(arg) or isinstance(arg, tuple):
+        if is_float(arg[0]) and is_float(arg[1]):
+            return arg[0], arg[1]
+        raise TypeError("Oops! Expected a lat/lng dict or tuple but got %s" % type(arg).__name__)
+    return None, None
+
+
+LATLON_INPUTS = [
+    (48.87, 2.34),
+    [48.87, 2.34],
+    (48, 2),
+    (numpy.float64(48.87), numpy.int32(2)),
+    (numpy.float32(48.87), 2.34, "extra"),
+    ("48.87", "2.34"),
+    (float("nan"), 2.34),
+    (48.87, float("nan")),
+    {"lat": 48.87, "lng": 2.34},
+    {"Latitude": 48.87, "Longitude": 2.34},
+    {"lat": 48.87, "lon": 2.34},
+    {"lat": 1.0, "lng": 2.0, "latitude": 3.0, "longitude": 4.0},
+    {"latitude": None, "longitude": None, "name": "Musee Grevin"},
+    {"name": "Musee Grevin"},
+    None,
+    "48.87,2.34",
+]
+
+
+
+def outcome(func, arg):
+    try:
+        return func(arg)
+    except TypeError:
+        return TypeError
+
+
+@pytest.mark.parametrize("arg", LATLON_INPUTS + [
+    shapely.geometry.Point(2.34, 48.87),
+    {"geometry": shapely.geometry.Point(2.34, 48.87), "lat": 1.0, "lng": 2.0},
+    ("a", "b"),
+    [None, 2.34],
+])
+def test_latlon_matches_the_generic_path(arg):
+    expected = outcome(reference_latlon, arg)
+    found = outcome(latlon, arg)
+
+    numpy.testing.assert_equal(found, expected)
+    if expected is not TypeError:
+        assert [type(v) for v in found] == [type(v) for v in expected]
+
+
+@pytest.mark.parametrize("arg", [a for a in LATLON_INPUTS if outcome(reference_latlon, a) is not TypeError])
+def test_point_coordinates_match_the_generic_path(arg):
+    point = Point(arg)
+
+    numpy.testing.assert_equal((point.latitude, point.longitude), reference_latlon(arg))
+
+
+@pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "json"])
+def test_to_ndjson_writes_null_for_non_finite_values(monkeypatch, use_orjson):
+    if use_orjson and geometry.orjson is None:
+        pytest.skip("orjson is not installed")
+    if not use_orjson:
+        monkeypatch.setattr(geometry, "orjson", None)
+
+    array = PointArray(
+        [48.871162, float("nan")],
+        [2.344007, float("inf")],
+        id=numpy.array([1, 2]),
+        score=[0.5, float("-inf")],
+        name=["Musée Grévin", None],
+        tags=numpy.array([{"rank": numpy.int64(1), "scores": [float("nan"), 2.0]}, None], dtype=object),
+    )
+    lines = array.to_ndjson().split("\n")
+
+    assert [json.loads(line) for line in lines] == [
+        {"latitude": 48.871162, "longitude": 2.344007, "id": 1, "score": 0.5, "name": "Musée Grévin", "tags": {"rank": 1, "scores": [None, 2.0]}},
+        {"latitude": None, "longitude": None, "id": 2, "score": None, "name": None, "tags": None},
+    ]
+    assert all("NaN" not in line and "Infinity" not in line for line in lines)
+
+
+def test_to_ndjson_is_the_same_with_and_without_orjson(monkeypatch, points):
+    if geometry.orjson is None:
+        pytest.skip("orjson is not installed")
+    array = PointArray.from_points(points + [Point({"latitude": float("nan"), "longitude": 2.0, "id": 4})])
+    expected = array.to_ndjson()
+
+    monkeypatch.setattr(geometry, "orjson", None)
+    assert array.to_ndjson() == expected
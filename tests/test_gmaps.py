@@ -0,0 +1,358 @@
+import asyncio
+import json
+
+import pytest
+
+from gistools import gmaps
+
+
+class FakeApi:
+    """Answers 'Find Place' URLs with a canned status per API key, and records the requests."""
+
+    def __init__(self, statuses):
+        self.statuses = statuses
+        self.urls = []
+
+    def status(self, url):
+        return next(status for key, status in self.statuses.items() if "key=%s" % key in url)
+
+    def body(self, url):
+        self.urls.append(url)
+        return json.dumps({"status": self.status(url), "candidates": [{"name": "Musee Grevin"}]}).encode()
+
+
+@pytest.fixture
+def api(monkeypatch, tmpdir):
+    fake = FakeApi({"GOOD": "OK", "EMPTY": "ZERO_RESULTS", "LIMIT": "OVER_QUERY_LIMIT", "BAD": "REQUEST_DENIED"})
+
+    monkeypatch.setattr(gmaps, "_http_get", lambda url, backend="requests": fake.body(url))
+    monkeypatch.setattr(gmaps, "_DISK_CACHE", None)
+    monkeypatch.setenv("GISTOOLS_GMAPS_CACHE_DB", str(tmpdir.join("cache.db")))
+    gmaps.get_place_info.cache_clear()
+    yield fake
+    gmaps.get_place_info.cache_clear()
+
+
+@pytest.mark.parametrize("key", ["GOOD", "EMPTY"])
+def test_successful_statuses_are_cached(api, key):
+    first = gmaps.get_place_info("Musee Grevin", key)
+    second = gmaps.get_place_info("Musee Grevin", key)
+
+    assert first == second
+    assert len(api.urls) == 1
+
+
+@pytest.mark.parametrize("key", ["LIMIT", "BAD"])
+def test_error_statuses_are_not_cached(api, key):
+    assert gmaps.get_place_info("Musee Grevin", key).status == api.statuses[key]
+    gmaps.get_place_info("Musee Grevin", key)
+
+    assert len(api.urls) == 2
+    assert gmaps._cache_get(gmaps._cache_key("Musee Grevin", gmaps._join_fields(gmaps.DEFAULT_FIELDS))) is None
+
+
+def test_error_status_is_not_replayed_for_another_key(api):
+    assert gmaps.get_place_info("Musee Grevin", "BAD").status == "REQUEST_DENIED"
+    assert gmaps.get_place_info("Musee Grevin", "GOOD").status == "OK"
+
+
+def test_cache_key_normalizes_the_address(api):
+    gmaps.get_place_info("Musee Grevin", "GOOD")
+    gmaps.get_place_info("  musee GREVIN ", "GOOD")
+
+    assert len(api.urls) == 1
+
+
+def test_cache_key_includes_the_fields(api):
+    gmaps.get_place_info("Musee Grevin", "GOOD", fields=("name",))
+    gmaps.get_place_info("Musee Grevin", "GOOD", fields=("name", "place_id"))
+
+    assert len(api.urls) == 2
+
+
+def test_disk_cache_survives_the_memory_cache(api):
+    gmaps.get_place_info("Musee Grevin", "GOOD")
+    gmaps._PLACE_CACHE.clear()
+    gmaps.get_place_info("Musee Grevin", "GOOD")
+
+    assert len(api.urls) == 1
+
+
+@pytest.mark.skipif(gmaps.aiohttp is None, reason="aiohttp is not installed")
+def test_many_caches_only_successful_statuses(api, monkeypatch):
+    async def fetch_json(session, url, semaphore, limiter=None):
+        return json.loads(api.body(url))
+
+    monkeypatch.setattr(gmaps, "_fetch_json", fetch_json)
+
+    results = asyncio.run(gmaps.get_place_info_many(["Musee Grevin", "Tour Eiffel"], "LIMIT"))
+    assert [r.status for r in results] == ["OVER_QUERY_LIMIT"] * 2
+
+    asyncio.run(gmaps.get_place_info_many(["Musee Grevin"], "GOOD"))
+    asyncio.run(gmaps.get_place_info_many(["Musee Grevin"], "GOOD"))
+    assert len(api.urls) == 3
+
+
+class FakeResponse:
+    def __init__(self, status, headers=None, body=b"{}"):
+        self.status = status
+        self.headers = headers or {}
+        self.body = body
+
+    async def read(self):
+        return self.body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    def __init__(self, status, headers=None):
+        self.status = status
+        self.headers = headers
+        self.calls = 0
+
+    def get(self, url):
+        self.calls += 1
+        return FakeResponse(self.status, self.headers)
+
+
+def test_fetch_json_does_not_sleep_after_the_last_attempt(monkeypatch):
+    sleeps = []
+
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    session = FakeSession(503)
+
+    async def run():
+        return await gmaps._fetch_json(session, "http://test", asyncio.Semaphore(1))
+
+    assert asyncio.run(run()) is None
+    assert session.calls == gmaps._MAX_ATTEMPTS
+    assert len(sleeps) == gmaps._MAX_ATTEMPTS - 1
+
+
+def test_fetch_json_does_not_retry_client_errors(monkeypatch):
+    session = FakeSession(400)
+
+    async def run():
+        return await gmaps._fetch_json(session, "http://test", asyncio.Semaphore(1))
+
+    assert asyncio.run(run()) is None
+    assert session.calls == 1
+
+
+@pytest.mark.parametrize(
+    "retry_after, expected",
+    [("2", 2.0), ("-3", 0.0), ("3600", gmaps._MAX_BACKOFF), ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0)],
+)
+def test_backoff_honors_and_caps_retry_after(retry_after, expected):
+    assert gmaps._backoff(0, retry_after) == expected
+
+
+def test_backoff_reads_http_dates():
+    from datetime import datetime, timedelta, timezone
+    from email.utils import format_datetime
+
+    retry_after = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=30), usegmt=True)
+    assert 25 < gmaps._backoff(0, retry_after) <= 30
+
+
+def test_backoff_falls_back_to_exponential_delays():
+    assert 0.5 <= gmaps._backoff(0, "not a delay") < 0.6
+    assert gmaps._backoff(20) == gmaps._MAX_BACKOFF
+
+
+@pytest.fixture
+def cache(monkeypatch, tmpdir):
+    monkeypatch.setattr(gmaps, "_DISK_CACHE", None)
+    monkeypatch.setenv("GISTOOLS_GMAPS_CACHE_DB", str(tmpdir.join("cache.db")))
+    gmaps.get_place_info.cache_clear()
+    yield
+    gmaps.get_place_info.cache_clear()
+
+
+def test_cache_hit_and_miss(cache):
+    assert gmaps.cache_get("geocode", ("Musee Grevin", "fr")) is None
+
+    gmaps.cache_set("geocode", ("Musee Grevin", "fr"), [{"place_id": "A"}])
+
+    assert gmaps.cache_get("geocode", ("Musee Grevin", "fr")) == [{"place_id": "A"}]
+    assert gmaps.cache_get("geocode", ("Musee Grevin", "en")) is None
+
+
+def test_cache_namespaces_are_isolated(cache):
+    gmaps.cache_set("geocode", ("A",), ["geocode"])
+    gmaps.cache_set("place", ("A",), ["place"])
+    gmaps.cache_set("place", ("a|b",), ["joined"])
+
+    assert gmaps.cache_get("geocode", ("A",)) == ["geocode"]
+    assert gmaps.cache_get("place", ("A",)) == ["place"]
+    assert gmaps.cache_get("place", ("a", "b")) is None
+
+    gmaps._PLACE_CACHE.clear()  # the sqlite layer must keep the namespaces apart too
+    assert gmaps.cache_get("geocode", ("A",)) == ["geocode"]
+    assert gmaps.cache_get("place", ("a", "b")) is None
+
+
+def test_cache_returns_copies(cache):
+    data = {"results": [{"place_id": "A"}]}
+    gmaps.cache_set("geocode", ("A",), data)
+    data["results"].clear()
+
+    first = gmaps.cache_get("geocode", ("A",))
+    first["results"].append({"place_id": "B"})
+
+    assert gmaps.cache_get("geocode", ("A",)) == {"results": [{"place_id": "A"}]}
+
+
+def test_place_info_batch_dedups_and_keeps_per_address_errors(monkeypatch):
+    calls = []
+
+    def get_place_info(address, api_key, fields=None, backend="requests", raw=False):
+        calls.append(address)
+        if address == "boom":
+            raise TimeoutError("Oops!")
+        return address.upper()
+
+    monkeypatch.setattr(gmaps, "get_place_info", get_place_info)
+
+    results = gmaps.get_place_info_batch(["a", "b", " A ", "boom", "b", "c"], "KEY", workers=4)
+
+    assert results[:3] == ["A", "B", "A"]
+    assert isinstance(results[3], TimeoutError)
+    assert results[4:] == ["B", "C"]
+    assert sorted(calls) == ["a", "b", "boom", "c"]
+
+
+@pytest.fixture
+def httpx_api(monkeypatch):
+    httpx = pytest.importorskip("httpx")
+    statuses = []
+
+    def handler(request):
+        status = statuses.pop(0) if statuses else 200
+        return httpx.Response(status, json={"status": "OK", "candidates": [{"name": request.url.params["input"]}]})
+
+    monkeypatch.setattr(gmaps, "_HTTPX_CLIENT", httpx.Client(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(gmaps.time, "sleep", lambda delay: None)
+    gmaps.get_place_info.cache_clear()
+    yield statuses
+    gmaps.get_place_info.cache_clear()
+
+
+def test_httpx_backend_retries_server_errors(httpx_api):
+    httpx_api.extend([503, 503])
+
+    assert gmaps.get_place_info("Musee Grevin", "KEY", backend="httpx").name == "Musee Grevin"
+    assert httpx_api == []
+
+
+def test_httpx_backend_gives_up_after_the_last_attempt(httpx_api):
+    httpx_api.extend([503] * (gmaps._MAX_ATTEMPTS + 1))
+
+    assert gmaps.get_place_info("Musee Grevin", "KEY", backend="httpx") is None
+    assert len(httpx_api) == 1
+
+
+def test_httpx_backend_does_not_retry_client_errors(httpx_api):
+    httpx_api.extend([400, 503])
+
+    assert gmaps.get_place_info("Musee Grevin", "KEY", backend="httpx") is None
+    assert httpx_api == [503]
+
+
+def test_httpx_client_is_shared(monkeypatch):
+    pytest.importorskip("h2")
+    monkeypatch.setattr(gmaps, "_HTTPX_CLIENT", None)
+
+    assert gmaps._get_httpx_client() is gmaps._get_httpx_client()
+
+
+def test_disk_cache_is_opened_once_across_threads(monkeypatch, tmpdir):
+    import threading
+
+    opened = []
+    disk_cache = gmaps._DiskCache
+
+    def open_cache(path, ttl):
+        opened.append(path)
+        return disk_cache(path, ttl)
+
+    monkeypatch.setattr(gmaps, "_DISK_CACHE", None)
+    monkeypatch.setattr(gmaps, "_DiskCache", open_cache)
+    monkeypatch.setenv("GISTOOLS_GMAPS_CACHE_DB", str(tmpdir.join("cache.db")))
+
+    barrier = threading.Barrier(8)
+    caches = []
+
+    def worker():
+        barrier.wait()
+        caches.append(gmaps._get_disk_cache())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(opened) == 1
+    assert all(cache is caches[0] for cache in caches)
+
+
+@pytest.fixture
+def keyfile(monkeypatch, tmpdir):
+    monkeypatch.setattr(gmaps, "_API_KEY", None)
+    gmaps._load_api_key.cache_clear()
+
+    def write(key, name="key.json"):
+        path = tmpdir.join(name)
+        path.write(json.dumps({"api_key": key}))
+        return str(path)
+
+    monkeypatch.setenv("GISTOOLS_GMAPS_KEY_FILE", write("OLD"))
+    yield write
+    gmaps._load_api_key.cache_clear()
+
+
+def test_api_key_is_read_once(keyfile):
+    assert gmaps.get_api_key() == "OLD"
+
+    keyfile("NEW")
+
+    assert gmaps.get_api_key() == "OLD"
+    assert gmaps.get_api_key() == "OLD"
+
+
+def test_reload_credentials_reads_the_rotated_key(keyfile):
+    assert gmaps.get_api_key() == "OLD"
+
+    keyfile("NEW")
+
+    assert gmaps.reload_credentials() == "NEW"
+    assert gmaps.get_api_key() == "NEW"
+
+
+def test_reload_credentials_follows_the_environment(keyfile, monkeypatch):
+    assert gmaps.get_api_key() == "OLD"
+
+    monkeypatch.setenv("GISTOOLS_GMAPS_KEY_FILE", keyfile("OTHER", name="other.json"))
+
+    assert gmaps.get_api_key() == "OLD"
+    assert gmaps.reload_credentials() == "OTHER"
+    assert gmaps.get_api_key() == "OTHER"
+
+
+def test_explicit_keyfiles_are_cached_until_reloaded(keyfile):
+    path = keyfile("EXPLICIT", name="explicit.json")
+    assert gmaps.get_api_key(path) == "EXPLICIT"
+
+    keyfile("ROTATED", name="explicit.json")
+
+    assert gmaps.get_api_key(path) == "EXPLICIT"
+    assert gmaps.reload_credentials(path) == "ROTATED"
@@ -0,0 +1,283 @@
+import asyncio
+import random
+
+import numpy
+import pandas
+import pytest
+
+from gistools import gmaps, place
+from gistools.place import (
+    Place,
+    _FIELD_TYPES,
+    _PLACE_FIELD_TYPES,
+    _get_component,
+    _index_components,
+    _postal_code_str,
+    _set_address_fields,
+)
+
+
+def component(long_name, *types, short_name=None):
+    return {"long_name": long_name, "short_name": short_name or long_name, "types": list(types)}
+
+
+GREVIN = [
+    component("10", "street_number"),
+    component("Boulevard Montmartre", "route", short_name="Bd Montmartre"),
+    component("Paris", "locality", "political"),
+    component("Département de Paris", "administrative_area_level_2", "political", short_name="Département de Paris"),
+    component("Île-de-France", "administrative_area_level_1", "political", short_name="IDF"),
+    component("France", "country", "political", short_name="FR"),
+    component("75009", "postal_code"),
+]
+
+
+def fields(components, field_types=_FIELD_TYPES):
+    return _set_address_fields({}, components, field_types)
+
+
+def test_address_fields_of_a_geocoding_result():
+    assert fields(GREVIN) == {
+        "street_number": "10",
+        "street": "Boulevard Montmartre",
+        "city": "Paris",
+        "sub_locality": "",
+        "postal_code": "75009",
+        "admin_area_level_2": "Département de Paris",
+        "admin_area_level_1": "Île-de-France",
+        "country": "France",
+        "country_code": "fr",
+    }
+
+
+def test_main_type_fields_ignore_secondary_types():
+    components = [component("Montmartre", "political", "route"), component("75018", "political", "postal_code")]
+
+    assert fields(components)["street"] == ""
+    assert fields(components)["postal_code"] == ""
+
+
+def test_any_type_fields_match_secondary_types():
+    components = [component("9e Arrondissement", "political", "sublocality", "sublocality_level_1")]
+
+    assert fields(components)["sub_locality"] == "9e Arrondissement"
+
+
+def test_first_matching_component_wins():
+    components = [component("Rue Drouot", "route"), component("Boulevard Montmartre", "route")]
+
+    assert fields(components)["street"] == "Rue Drouot"
+
+
+@pytest.mark.parametrize(
+    "components, city",
+    [
+        ([component("London", "postal_town"), component("Westminster", "locality", "political")], "London"),
+        ([component("Westminster", "locality", "political"), component("London", "postal_town")], "Westminster"),
+    ],
+)
+def test_postal_town_and_locality_take_the_first_one(components, city):
+    assert fields(components)["city"] == city
+
+
+def test_country_code_is_lowercased():
+    assert fields([component("United Kingdom", "country", "political", short_name="GB")])["country_code"] == "gb"
+
+
+def test_place_details_take_the_street_from_a_route_only():
+    components = [component("Les Halles", "colloquial_area", "political"), component("Rue Rambuteau", "route")]
+
+    assert fields(components)["street"] == "Les Halles"
+    assert fields(components, _PLACE_FIELD_TYPES)["street"] == "Rue Rambuteau"
+    assert fields(components[:1], _PLACE_FIELD_TYPES)["street"] == ""
+
+
+def reference_field(components, types, any_type, name):
+    # The per-field loops replaced by the table: first component whose main type (or any type) is accepted
+    for c in components:
+        if (any(t in c["types"] for t in types) if any_type else c["types"][0] in types):
+            return c[name]
+    return ""
+
+
+def test_address_fields_match_the_per_field_loops():
+    rng = random.Random(3)
+    types = sorted({t for ts, _, _ in _FIELD_TYPES.values() for t in ts} | {"political", "sublocality_level_1"})
+
+    for _ in range(500):
+        components = [
+            component("c%d" % k, *rng.sample(types, rng.randint(1, 3)), short_name="S%d" % k)
+            for k in range(rng.randint(0, 8))
+        ]
+
+        for field_types in (_FIELD_TYPES, _PLACE_FIELD_TYPES):
+            expected = {field: reference_field(components, *spec) for field, spec in field_types.items()}
+            expected["country_code"] = expected["country_code"].lower()
+
+            assert fields(components, field_types) == expected
+
+
+def test_index_components_keeps_the_first_position_of_each_type():
+    main_types, all_types = _index_components(GREVIN + [component("Paris 9e", "sublocality", "political")])
+
+    assert main_types["locality"] == 2
+    assert main_types["sublocality"] == 7
+    assert "political" not in main_types
+    assert all_types["political"] == 2
+    assert all_types["country"] == 5
+
+
+def test_get_component_reads_the_first_accepted_component():
+    main_types, all_types = _index_components(GREVIN)
+
+    assert _get_component(GREVIN, main_types, ("postal_code", "route")) == "Boulevard Montmartre"
+    assert _get_component(GREVIN, main_types, ("country",), name="short_name") == "FR"
+    assert _get_component(GREVIN, main_types, ("political",)) == ""
+    assert _get_component(GREVIN, all_types, ("political",)) == "Paris"
+    assert _get_component([], {}, ("route",)) == ""
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (75009, "75009"),
+        (75009.0, "75009"),
+        (numpy.float64(75009.0), "75009"),
+        ("01000", "01000"),
+        (1000, "1000"),
+        (" sw1a 1aa ", "SW1A1AA"),
+        ("75009.5", "75009.5"),
+        (True, "TRUE"),
+    ],
+)
+def test_postal_code_str(value, expected):
+    assert _postal_code_str(value) == expected
+
+
+def confidence_on_postal_code(input_postal_code, postal_code):
+    return Place._Place__get_confidence_on_postal_code({"input_postal_code": input_postal_code}, {"postal_code": postal_code})
+
+
+@pytest.mark.parametrize(
+    "input_postal_code, postal_code, expected",
+    [
+        (75009, "75009", 1),
+        (75009.0, "75009", 1),
+        (numpy.float64(75009.0), "75009", 1),
+        ("01000", "01000", 1),
+        (1000, "01000", 1),
+        ("1000", "01000", 1),
+        ("SW1A 1AA", "SW1A 1AA", 1),
+        ("sw1a1aa", "SW1A 1AA", 1),
+        ("SW1A 1AB", "SW1A 1AA", 0),
+        (75008, "75009", 0),
+        (75009, None, 0),
+        (None, "75009", 1),
+        (float("nan"), "75009", 1),
+    ],
+)
+def test_confidence_on_postal_code(input_postal_code, postal_code, expected):
+    assert confidence_on_postal_code(input_postal_code, postal_code) == expected
+
+
+def result(address, place_id):
+    return {
+        "formatted_address": address,
+        "place_id": place_id,
+        "geometry": {"location": {"lat": 48.87, "lng": 2.34}, "location_type": "ROOFTOP"},
+        "address_components": [
+            {"long_name": "Paris", "short_name": "Paris", "types": ["locality", "political"]},
+            {"long_name": "France", "short_name": "FR", "types": ["country", "political"]},
+        ],
+    }
+
+
+RESULTS = {
+    "1 Rue de Rivoli Paris": [result("1 Rue de Rivoli, 75001 Paris, France", "P1")],
+    "10 Boulevard Montmartre Paris": [result("10 Boulevard Montmartre, 75009 Paris, France", "P2")],
+    "5 Rue Drouot Paris": [result("5 Rue Drouot, 75009 Paris, France", "P3")],
+}
+
+
+class Stub:
+    """googlemaps.Client stand-in, used for the requests that do not go through geocode_many."""
+
+    key = "KEY"
+
+    def __init__(self):
+        self.geocoded = []
+
+    def geocode(self, address, components=None, language=None):
+        self.geocoded.append(address)
+        if address not in RESULTS:
+            raise RuntimeError("Oops! Unknown address")
+        return RESULTS[address]
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    monkeypatch.setattr(gmaps, "_DISK_CACHE", None)
+    monkeypatch.delenv("GISTOOLS_GMAPS_CACHE_DB", raising=False)
+    gmaps.get_place_info.cache_clear()
+
+    async def geocode_many(addresses, api_key, components=None, language=None, concurrency=10, queries_per_second=10):
+        # '5 Rue Drouot' is rate limited (None) and 'boom' fails, the others are answered directly
+        answers = {"5 Rue Drouot Paris": None, "boom": ConnectionError("Oops!")}
+        return [answers[a] if a in answers else RESULTS.get(a, []) for a in addresses]
+
+    monkeypatch.setattr(place, "geocode_many", geocode_many)
+    yield Stub()
+    gmaps.get_place_info.cache_clear()
+
+
+def places(*addresses):
+    return [place.Place(address=a) for a in addresses]
+
+
+def test_batch_geocode_keeps_the_order(stub):
+    out = asyncio.run(place.batch_geocode(places("10 Boulevard Montmartre Paris", "1 Rue de Rivoli Paris"), stub=stub))
+
+    assert [p.data["place_id"] for p in out] == ["P2", "P1"]
+    assert [p.data["api_used"] for p in out] == ["geocode", "geocode"]
+    assert stub.geocoded == []
+
+
+def test_batch_geocode_retries_failed_requests_with_the_client(stub):
+    out = asyncio.run(place.batch_geocode(places("5 Rue Drouot Paris", "1 Rue de Rivoli Paris"), stub=stub))
+
+    assert [p.data["place_id"] for p in out] == ["P3", "P1"]
+    assert stub.geocoded == ["5 Rue Drouot Paris"]
+
+
+def test_batch_geocode_isolates_a_failed_row(stub):
+    out = asyncio.run(place.batch_geocode(places("1 Rue de Rivoli Paris", "boom", "10 Boulevard Montmartre Paris"), stub=stub))
+
+    assert [p.data["place_id"] for p in out] == ["P1", "", "P2"]
+    assert out[1].data["location_type"] == "NOT_FOUND"
+
+
+def test_geocode_dataframe(stub):
+    df = pandas.DataFrame(
+        {"address": ["10 Boulevard Montmartre Paris", " 1 Rue de Rivoli Paris ", None, "boom", "", "10 Boulevard Montmartre Paris"]},
+        index=list("abcdef"),
+    )
+
+    out = place.geocode_dataframe(df, stub=stub)
+
+    assert list(out.index) == list("abcdef")
+    assert set(place._RESULT_TEMPLATE) <= set(out.columns)
+    assert {"input_text", "latitude", "longitude", "plus_code"} <= set(out.columns)
+    assert list(out["place_id"].fillna("-")) == ["P2", "P1", "-", "", "-", "P2"]
+    assert out.loc["a"].equals(out.loc["f"])
+
+
+def test_geocode_dataframe_passes_the_thresholds(stub, monkeypatch):
+    thresholds = []
+    monkeypatch.setattr(place.Place, "set_thresholds", lambda self, **kwargs: thresholds.append(kwargs))
+    df = pandas.DataFrame({"address": ["1 Rue de Rivoli Paris"]})
+
+    place.geocode_dataframe(df, stub=stub)
+    assert {} not in thresholds  # no extra call without thresholds
+
+    place.geocode_dataframe(df, stub=stub, threshold=0.5)
+    assert thresholds[-1] == {"threshold": 0.5}
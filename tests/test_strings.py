@@ -0,0 +1,109 @@
+import random
+import unicodedata
+
+import pytest
+
+from gistools.strings import (
+    levenshtein_distance,
+    longest_common_subsequence,
+    longest_common_substring,
+    remove_redundant_whitespaces,
+    similarity,
+    similarity_batch,
+    similarity_pairs,
+)
+
+ALPHABET = "abcde  éàCEDEX-'"
+
+
+def reference_lcs(a, b):
+    # Classic DP matrix with the last column read out, as before the bit-parallel kernel
+    lengths = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            if x == y:
+                lengths[i + 1][j + 1] = lengths[i][j] + 1
+            else:
+                lengths[i + 1][j + 1] = max(lengths[i + 1][j], lengths[i][j + 1])
+    result = ""
+    j = len(b)
+    for i in range(1, len(a) + 1):
+        if lengths[i][j] != lengths[i - 1][j]:
+            result += a[i - 1]
+    return remove_redundant_whitespaces(result)
+
+
+def reference_levenshtein(token1, token2):
+    # Levenshtein distance with a substitution cost of 2, as before the LCS-based formula
+    if len(token1) == 0 or len(token2) == 0:
+        return {"distance": 0, "ratio": 0}
+    s1 = unicodedata.normalize("NFKD", token1).encode("ascii", "ignore")
+    s2 = unicodedata.normalize("NFKD", token2).encode("ascii", "ignore")
+    m, n = len(s1), len(s2)
+    d = [[i + j if i == 0 or j == 0 else 0 for j in range(n + 1)] for i in range(m + 1)]
+    for i in range(1, m + 1):
+        for j in range(1, n + 1):
+            if s1[i - 1] == s2[j - 1]:
+                d[i][j] = d[i - 1][j - 1]
+            else:
+                d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1, d[i - 1][j - 1] + 2)
+    return {"distance": d[m][n], "ratio": (m + n - d[m][n]) / float(m + n)}
+
+
+def reference_substring(s1, s2):
+    m = [[0] * (1 + len(s2)) for _ in range(1 + len(s1))]
+    longest, x_longest = 0, 0
+    for x in range(1, 1 + len(s1)):
+        for y in range(1, 1 + len(s2)):
+            if s1[x - 1] == s2[y - 1]:
+                m[x][y] = m[x - 1][y - 1] + 1
+                if m[x][y] > longest:
+                    longest = m[x][y]
+                    x_longest = x
+    return remove_redundant_whitespaces(s1[x_longest - longest: x_longest])
+
+
+@pytest.fixture
+def pairs():
+    rng = random.Random(42)
+
+    def word():
+        return "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 14)))
+
+    return [(word(), word()) for _ in range(2000)]
+
+
+def test_longest_common_subsequence_matches_dp(pairs):
+    for a, b in pairs:
+        assert longest_common_subsequence(a, b) == reference_lcs(a, b)
+
+
+def test_longest_common_substring_matches_dp(pairs):
+    for a, b in pairs:
+        assert longest_common_substring(a, b) == reference_substring(a, b)
+
+
+def test_levenshtein_distance_matches_dp(pairs):
+    for a, b in pairs:
+        assert levenshtein_distance(a, b) == reference_levenshtein(a, b)
+
+
+@pytest.mark.parametrize("lcs", [False, True])
+def test_similarity_batch_matches_similarity(pairs, lcs):
+    lefts = [a for a, _ in pairs[:500]]
+    choices = [b for _, b in pairs[:20]]
+    for left in lefts:
+        expected = [similarity(left, choice, lcs=lcs) for choice in choices]
+        assert similarity_batch(left, choices, lcs=lcs) == pytest.approx(expected, abs=1e-12)
+
+
+@pytest.mark.parametrize("lcs", [False, True])
+def test_similarity_pairs_matches_similarity(pairs, lcs):
+    lefts, rights = [a for a, _ in pairs], [b for _, b in pairs]
+    expected = [similarity(a, b, lcs=lcs) for a, b in pairs]
+    assert similarity_pairs(lefts, rights, lcs=lcs) == pytest.approx(expected, abs=1e-12)
+
+
+def test_similarity_identical_strings():
+    assert similarity("Musée Grévin", "musée grévin", lcs=True) == 1.0
+    assert similarity("Paris CEDEX", "paris", lcs=False) == 1.0